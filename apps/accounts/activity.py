@@ -0,0 +1,142 @@
+"""
+Écriture groupée de last_login et last_activity.
+
+Métier : Après une coupure réseau, toute une zone se reconnecte en même
+temps ; un UPDATE de accounts_user par connexion et par requête entre alors
+en concurrence avec les écritures de synchronisation. Les horodatages sont
+gardés en mémoire (une entrée par utilisateur, seule la plus récente
+compte) et écrits toutes les ACTIVITY_FLUSH_INTERVAL secondes en quelques
+UPDATE ... CASE, par lots de ACTIVITY_FLUSH_BATCH_SIZE utilisateurs.
+
+L'écriture est déclenchée par la requête qui suit l'intervalle, et à
+l'arrêt du processus. Perdre quelques secondes d'horodatage en cas
+d'arrêt brutal est acceptable pour ces champs indicatifs.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+from mavecam_api.db_router import untracked_writes
+
+logger = logging.getLogger(__name__)
+
+TRACKED_FIELDS = ('last_login', 'last_activity')
+
+
+class ActivityBuffer:
+    """
+    Tampon en mémoire des horodatages par utilisateur.
+
+    pending : {user_id: {champ: datetime}}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flush = time.monotonic()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, user_id, *fields, when=None):
+        """
+        Note un horodatage pour un utilisateur, puis écrit le tampon si
+        l'intervalle est écoulé.
+
+        Args:
+            user_id: clé primaire de l'utilisateur
+            fields: champs à mettre à jour (last_login, last_activity)
+            when (datetime): horodatage, maintenant par défaut
+        """
+        when = when or timezone.now()
+        with self._lock:
+            entry = self._pending.setdefault(user_id, {})
+            for field in fields:
+                if entry.get(field) is None or entry[field] < when:
+                    entry[field] = when
+            due = time.monotonic() - self._last_flush >= settings.ACTIVITY_FLUSH_INTERVAL
+
+        if due:
+            # L'écriture se fait pendant la requête d'un utilisateur quelconque :
+            # une base verrouillée ne doit pas la faire échouer
+            try:
+                self.flush()
+            except DatabaseError:
+                logger.exception("Écriture des horodatages d'activité reportée")
+
+    def record_login(self, user_id):
+        self.record(user_id, 'last_login', 'last_activity')
+
+    def record_activity(self, user_id):
+        self.record(user_id, 'last_activity')
+
+    def _merge(self, unwritten):
+        """Remet dans le tampon des horodatages non écrits (sous verrou)."""
+        for user_id, fields in unwritten.items():
+            entry = self._pending.setdefault(user_id, {})
+            for field, when in fields.items():
+                if entry.get(field) is None or entry[field] < when:
+                    entry[field] = when
+
+    def clear(self):
+        """Vide le tampon sans écrire (tests)."""
+        with self._lock:
+            self._pending = {}
+
+    def flush(self):
+        """
+        Écrit le tampon en base : un UPDATE ... CASE par lot d'utilisateurs.
+
+        En cas d'erreur, les lots non écrits sont remis dans le tampon pour
+        la prochaine écriture et l'erreur est propagée.
+
+        Returns:
+            int: nombre d'utilisateurs mis à jour
+        """
+        from .models import User
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        updated = 0
+        user_ids = list(pending)
+        batch_size = settings.ACTIVITY_FLUSH_BATCH_SIZE
+        with untracked_writes():
+            for start in range(0, len(user_ids), batch_size):
+                batch = user_ids[start:start + batch_size]
+                changes = {}
+                for field in TRACKED_FIELDS:
+                    whens = [
+                        When(pk=user_id, then=Value(pending[user_id][field]))
+                        for user_id in batch if field in pending[user_id]
+                    ]
+                    if whens:
+                        changes[field] = Case(*whens, default=F(field))
+                try:
+                    updated += User.objects.filter(pk__in=batch).update(**changes)
+                except DatabaseError:
+                    with self._lock:
+                        self._merge({user_id: pending[user_id] for user_id in user_ids[start:]})
+                    raise
+        return updated
+
+
+activity_buffer = ActivityBuffer()
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        activity_buffer.flush()
+    except DatabaseError:
+        logger.exception("Écriture des horodatages d'activité impossible à l'arrêt")
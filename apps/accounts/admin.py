@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from django.urls import reverse
+from .labels import choice_label, get_label_maps
 from .models import User, FarmProfile
 
 
@@ -108,7 +109,7 @@ class UserAdmin(BaseUserAdmin):
             return format_html(
                 '<span style="color: {};">{}</span>',
                 colors.get(status, 'black'),
-                obj.farm_profile.get_certification_status_display()
+                choice_label('certification_status', status)
             )
         return '-'
     farm_certification_status.short_description = 'Certification'
@@ -156,14 +157,17 @@ class UserAdmin(BaseUserAdmin):
             'Certification', 'Date inscription'
         ])
         
+        labels = get_label_maps()
         for user in queryset:
-            certification = user.farm_profile.certification_status if hasattr(user, 'farm_profile') else 'N/A'
+            certification = labels['certification_status'].get(
+                user.farm_profile.certification_status, 'N/A'
+            ) if hasattr(user, 'farm_profile') else 'N/A'
             writer.writerow([
                 user.phone_number,
                 user.display_name, 
-                user.get_account_type_display(),
-                user.get_region_display() if user.region else '',
-                user.get_activity_type_display() if user.activity_type else '',
+                labels['account_type'].get(user.account_type, ''),
+                labels['region'].get(user.region, ''),
+                labels['activity_type'].get(user.activity_type, ''),
                 certification,
                 user.date_joined.strftime('%Y-%m-%d')
             ])
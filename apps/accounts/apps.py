@@ -13,3 +13,9 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
     verbose_name = 'Comptes Utilisateurs MAVECAM'
+
+    def ready(self):
+        from .labels import build_label_maps
+
+        # Libellés des choix calculés une fois par langue
+        build_label_maps()
@@ -0,0 +1,18 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .activity import activity_buffer
+
+
+class ActivityJWTAuthentication(JWTAuthentication):
+    """
+    Authentification JWT qui note la dernière activité de l'utilisateur.
+
+    L'horodatage passe par le tampon d'activité : aucune écriture en base
+    par requête.
+    """
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            activity_buffer.record_activity(result[0].pk)
+        return result
@@ -4,57 +4,58 @@ Constantes et choix pour l'application accounts.
 Basées sur la recherche officielle des divisions administratives
 et statuts juridiques du Cameroun en 2024.
 """
+from django.utils.translation import gettext_lazy as _
 
 # Types de compte
 ACCOUNT_TYPE_CHOICES = [
-    ('individual', 'Personne physique'),
-    ('company', 'Entreprise'),
+    ('individual', _('Personne physique')),
+    ('company', _('Entreprise')),
 ]
 
 # Types d'activité aquacole (maillon d'activité)
 ACTIVITY_TYPE_CHOICES = [
-    ('alevins', 'Producteur d\'alevins'),
-    ('poisson_table', 'Producteur de poisson de table'),
-    ('mixte', 'Production mixte (alevins et poisson de table)'),
+    ('alevins', _('Producteur d\'alevins')),
+    ('poisson_table', _('Producteur de poisson de table')),
+    ('mixte', _('Production mixte (alevins et poisson de table)')),
 ]
 
 # Statuts juridiques camerounais (basé sur recherche 2024)
 LEGAL_STATUS_CHOICES = [
     # Entreprises individuelles
-    ('ei', 'Entreprise Individuelle (EI)'),
+    ('ei', _('Entreprise Individuelle (EI)')),
     
     # Coopératives (qui ont remplacé les GIC)
-    ('scoop', 'Coopérative Simplifiée (SCOOP)'),
-    ('coop_ca', 'Coopérative avec Conseil d\'Administration (Coop-CA)'),
+    ('scoop', _('Coopérative Simplifiée (SCOOP)')),
+    ('coop_ca', _('Coopérative avec Conseil d\'Administration (Coop-CA)')),
     
     # Sociétés commerciales
-    ('sarl', 'Société à Responsabilité Limitée (SARL)'),
-    ('sarlu', 'SARL Unipersonnelle (SARLU)'),
-    ('sa', 'Société Anonyme (SA)'),
-    ('sas', 'Société par Actions Simplifiée (SAS)'),
-    ('sasu', 'SAS Unipersonnelle (SASU)'),
-    ('snc', 'Société en Nom Collectif (SNC)'),
-    ('scs', 'Société en Commandite Simple (SCS)'),
+    ('sarl', _('Société à Responsabilité Limitée (SARL)')),
+    ('sarlu', _('SARL Unipersonnelle (SARLU)')),
+    ('sa', _('Société Anonyme (SA)')),
+    ('sas', _('Société par Actions Simplifiée (SAS)')),
+    ('sasu', _('SAS Unipersonnelle (SASU)')),
+    ('snc', _('Société en Nom Collectif (SNC)')),
+    ('scs', _('Société en Commandite Simple (SCS)')),
     
     # Sociétés civiles
-    ('sci', 'Société Civile Immobilière (SCI)'),
+    ('sci', _('Société Civile Immobilière (SCI)')),
     
     # Autres
-    ('autre', 'Autre statut juridique'),
+    ('autre', _('Autre statut juridique')),
 ]
 
 # 10 Régions du Cameroun (recherche officielle 2024)
 REGION_CHOICES = [
-    ('adamaoua', 'Adamaoua'),
-    ('centre', 'Centre'),
-    ('est', 'Est'),
-    ('extreme_nord', 'Extrême-Nord'),
-    ('littoral', 'Littoral'),
-    ('nord', 'Nord'),
-    ('nord_ouest', 'Nord-Ouest'),
-    ('ouest', 'Ouest'),
-    ('sud', 'Sud'),
-    ('sud_ouest', 'Sud-Ouest'),
+    ('adamaoua', _('Adamaoua')),
+    ('centre', _('Centre')),
+    ('est', _('Est')),
+    ('extreme_nord', _('Extrême-Nord')),
+    ('littoral', _('Littoral')),
+    ('nord', _('Nord')),
+    ('nord_ouest', _('Nord-Ouest')),
+    ('ouest', _('Ouest')),
+    ('sud', _('Sud')),
+    ('sud_ouest', _('Sud-Ouest')),
 ]
 
 # Départements par région (58 départements au total)
@@ -141,12 +142,12 @@ DEPARTMENT_BY_REGION = {
 
 # Classes d'âge pour personnes physiques
 AGE_GROUP_CHOICES = [
-    ('18_25', '18-25 ans'),
-    ('26_35', '26-35 ans'),
-    ('36_45', '36-45 ans'),
-    ('46_55', '46-55 ans'),
-    ('56_65', '56-65 ans'),
-    ('65_plus', '65 ans et plus'),
+    ('18_25', _('18-25 ans')),
+    ('26_35', _('26-35 ans')),
+    ('36_45', _('36-45 ans')),
+    ('46_55', _('46-55 ans')),
+    ('56_65', _('56-65 ans')),
+    ('65_plus', _('65 ans et plus')),
 ]
 
 # Langues supportées
@@ -0,0 +1,110 @@
+"""
+Libellés des choix précalculés par langue.
+
+Métier : get_FOO_display() résout la traduction paresseuse à chaque objet ;
+dans un export CSV de plusieurs milliers de pisciculteurs ou une liste de
+fermes, ce coût se répète pour des libellés qui ne changent jamais entre
+deux déploiements. Les libellés sont donc calculés une fois par langue
+(au démarrage, dans AccountsConfig.ready) puis servis depuis des
+dictionnaires figés.
+
+Les dictionnaires sont reconstruits quand les réglages de traduction
+changent (LANGUAGES, LANGUAGE_CODE, LOCALE_PATHS) ; un nouveau catalogue
+compilé est pris en compte au redémarrage, comme pour gettext.
+"""
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import translation
+
+from .constants import (
+    ACCOUNT_TYPE_CHOICES, ACTIVITY_TYPE_CHOICES, AGE_GROUP_CHOICES,
+    LANGUAGE_CHOICES, LEGAL_STATUS_CHOICES, REGION_CHOICES,
+)
+
+_label_maps = {}
+
+
+def choice_fields():
+    """
+    Champs à choix exposés aux clients, par nom de champ.
+
+    Returns:
+        dict: {champ: liste de choix}
+    """
+    from .models import FarmProfile
+
+    return {
+        'account_type': ACCOUNT_TYPE_CHOICES,
+        'activity_type': ACTIVITY_TYPE_CHOICES,
+        'legal_status': LEGAL_STATUS_CHOICES,
+        'region': REGION_CHOICES,
+        'age_group': AGE_GROUP_CHOICES,
+        'language_preference': LANGUAGE_CHOICES,
+        'certification_status': FarmProfile.CERTIFICATION_STATUS_CHOICES,
+    }
+
+
+def build_label_maps():
+    """
+    Calcule les libellés de tous les champs à choix pour chaque langue.
+
+    Returns:
+        dict: {langue: {champ: {valeur: libellé}}} (dictionnaires figés)
+    """
+    fields = choice_fields()
+    maps = {}
+    for language, _name in settings.LANGUAGES:
+        with translation.override(language):
+            maps[language] = MappingProxyType({
+                field: MappingProxyType({value: str(label) for value, label in choices})
+                for field, choices in fields.items()
+            })
+
+    _label_maps.clear()
+    _label_maps.update(maps)
+    return maps
+
+
+def get_label_maps(language=None):
+    """
+    Libellés de tous les champs à choix dans une langue.
+
+    Args:
+        language (str): code langue, par défaut la langue active
+            (fixée par UserLanguageMiddleware)
+
+    Returns:
+        MappingProxyType: {champ: {valeur: libellé}}
+    """
+    if not _label_maps:
+        build_label_maps()
+
+    try:
+        language = translation.get_supported_language_variant(
+            language or translation.get_language() or settings.LANGUAGE_CODE
+        )
+    except LookupError:
+        language = translation.get_supported_language_variant(settings.LANGUAGE_CODE)
+    return _label_maps[language]
+
+
+def choice_label(field, value, language=None):
+    """
+    Libellé d'une valeur de choix (équivalent de get_FOO_display()).
+
+    Returns:
+        str: libellé traduit, la valeur brute si elle est inconnue,
+            chaîne vide si la valeur est vide
+    """
+    if not value:
+        return ''
+    return get_label_maps(language)[field].get(value, value)
+
+
+@receiver(setting_changed)
+def reset_label_maps(setting, **kwargs):
+    if setting in ('LANGUAGES', 'LANGUAGE_CODE', 'LOCALE_PATHS'):
+        _label_maps.clear()
@@ -0,0 +1,104 @@
+"""
+Compilation des catalogues de traduction : `python manage.py compile_translations`.
+
+Équivalent de compilemessages sans dépendre de l'outil msgfmt de GNU
+gettext, absent des serveurs de déploiement. Les libellés de choix
+précalculés (accounts.labels) sont construits depuis ces catalogues au
+démarrage : à lancer à chaque build, avant le redémarrage des workers.
+"""
+import ast
+import struct
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+MO_MAGIC = 0x950412de
+
+
+def parse_po(path):
+    """
+    Lit un fichier .po (entrées simples, sans pluriels).
+
+    Les entrées marquées fuzzy et les traductions vides sont ignorées.
+
+    Returns:
+        dict: {msgid: msgstr}
+    """
+    messages = {}
+    entry = {}
+    section = None
+    fuzzy = False
+
+    def flush():
+        if 'msgid' in entry and entry.get('msgstr') and not fuzzy:
+            messages[entry['msgid']] = entry['msgstr']
+
+    for number, line in enumerate(Path(path).read_text(encoding='utf-8').splitlines(), start=1):
+        line = line.strip()
+        if line.startswith('#,') and 'fuzzy' in line:
+            flush()
+            entry, section, fuzzy = {}, None, True
+        elif not line or line.startswith('#'):
+            continue
+        elif line.startswith('msgid '):
+            if section == 'msgstr':
+                flush()
+                entry, fuzzy = {}, False
+            section = 'msgid'
+            entry['msgid'] = ast.literal_eval(line[6:])
+        elif line.startswith('msgstr '):
+            section = 'msgstr'
+            entry['msgstr'] = ast.literal_eval(line[7:])
+        elif line.startswith('"') and section:
+            entry[section] += ast.literal_eval(line)
+        else:
+            raise CommandError(f"{path}:{number} : ligne non prise en charge ({line[:40]})")
+
+    flush()
+    return messages
+
+
+def write_mo(messages, path):
+    """Écrit un catalogue .mo (format GNU, sans table de hachage)."""
+    keys = sorted(messages)
+    ids = b''
+    strs = b''
+    offsets = []
+    for key in keys:
+        msgid = key.encode('utf-8')
+        msgstr = messages[key].encode('utf-8')
+        offsets.append((len(ids), len(msgid), len(strs), len(msgstr)))
+        ids += msgid + b'\0'
+        strs += msgstr + b'\0'
+
+    count = len(keys)
+    ids_start = 7 * 4 + 16 * count
+    strs_start = ids_start + len(ids)
+    table = []
+    for id_offset, id_length, str_offset, str_length in offsets:
+        table.append((id_length, ids_start + id_offset, str_length, strs_start + str_offset))
+
+    with open(path, 'wb') as output:
+        output.write(struct.pack('Iiiiiii', MO_MAGIC, 0, count, 7 * 4, 7 * 4 + count * 8, 0, 0))
+        for id_length, id_offset, _str_length, _str_offset in table:
+            output.write(struct.pack('ii', id_length, id_offset))
+        for _id_length, _id_offset, str_length, str_offset in table:
+            output.write(struct.pack('ii', str_length, str_offset))
+        output.write(ids)
+        output.write(strs)
+
+
+class Command(BaseCommand):
+    help = "Compile les fichiers .po des LOCALE_PATHS en .mo (sans msgfmt)."
+
+    def handle(self, *args, **options):
+        compiled = 0
+        for locale_path in settings.LOCALE_PATHS:
+            for po_path in sorted(Path(locale_path).glob('*/LC_MESSAGES/*.po')):
+                messages = parse_po(po_path)
+                write_mo(messages, po_path.with_suffix('.mo'))
+                compiled += 1
+                self.stdout.write(f"{po_path} : {len(messages)} message(s)")
+
+        self.stdout.write(self.style.SUCCESS(f"{compiled} catalogue(s) compilé(s)"))
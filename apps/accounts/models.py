@@ -126,6 +126,13 @@ class User(AbstractUser):
         help_text=_('Zone géographique d\'intervention de l\'activité')
     )
     
+    last_activity = models.DateTimeField(
+        _('Dernière activité'),
+        blank=True,
+        null=True,
+        help_text=_('Dernière requête authentifiée (mise à jour par lots)')
+    )
+    
     # Désactiver le username (on utilise phone_number)
     username = None
     
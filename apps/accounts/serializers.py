@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from .labels import choice_label
 from .models import User, FarmProfile
 from .validators import PhoneNumberValidator
 
@@ -137,7 +138,7 @@ class FarmProfileSerializer(serializers.ModelSerializer):
     Serializer pour les profils de fermes MAVECAM.
     """
     is_certified = serializers.BooleanField(read_only=True)
-    certification_status_display = serializers.CharField(read_only=True)
+    certification_status_display = serializers.SerializerMethodField()
     
     class Meta:
         model = FarmProfile
@@ -152,6 +153,9 @@ class FarmProfileSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at', 'is_certified', 'certification_status_display'
         )
     
+    def get_certification_status_display(self, obj):
+        return choice_label('certification_status', obj.certification_status)
+    
     def validate_farm_name(self, value):
         if not value or not value.strip():
             raise serializers.ValidationError("Le nom de la ferme ne peut pas être vide.")
@@ -20,4 +20,7 @@ urlpatterns = [
     # Profile management
     path('profile/', views.ProfileView.as_view(), name='profile'),
     path('farm/', views.FarmProfileView.as_view(), name='farm_profile'),
+    
+    # Reference data
+    path('choices/', views.ChoicesView.as_view(), name='choices'),
 ]
\ No newline at end of file
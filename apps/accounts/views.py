@@ -2,9 +2,10 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import login
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiExample
 
+from .activity import activity_buffer
+from .labels import get_label_maps
 from .models import User
 
 from .serializers import (
@@ -159,7 +160,8 @@ class LoginView(APIView):
         serializer.is_valid(raise_exception=True)
         
         user = serializer.validated_data['user']
-        login(request, user)
+        # API mobile JWT : pas de session Django, last_login écrit par lots
+        activity_buffer.record_login(user.pk)
         
         refresh = RefreshToken.for_user(user)
         
@@ -224,3 +226,25 @@ class FarmProfileView(generics.RetrieveUpdateAPIView):
     
     def get_object(self):
         return self.request.user.farm_profile
+
+
+class ChoicesView(APIView):
+    """
+    📋 Libellés des listes de choix (formulaires de l'app mobile).
+    
+    Renvoie, dans la langue active, les libellés de tous les champs à
+    choix : type de compte, activité, statut juridique, région, classe
+    d'âge, langue et statut de certification.
+    
+    Les libellés sont précalculés au démarrage : aucune requête en base.
+    """
+    permission_classes = [permissions.AllowAny]
+    
+    @extend_schema(
+        summary="Libellés des listes de choix",
+        responses={200: OpenApiResponse(description="{champ: {valeur: libellé}}")}
+    )
+    def get(self, request):
+        return Response({
+            field: dict(labels) for field, labels in get_label_maps().items()
+        })
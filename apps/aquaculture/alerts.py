@@ -0,0 +1,292 @@
+"""
+Moteur d'alertes sanitaires incrémental.
+
+Métier : Le cahier des charges demande des alertes sanitaires (qualité de
+l'eau, mortalité anormale). Plutôt que de relire l'historique d'un cycle
+après chaque saisie, le moteur garde pour chaque cycle un petit état en
+mémoire (dernières mesures sur une fenêtre glissante, début du dépassement
+en cours) et évalue les règles mesure par mesure.
+
+Trois types de règles :
+- ThresholdRule : valeur hors de la plage optimale de l'espèce
+- RateOfChangeRule : variation trop rapide sur la fenêtre glissante
+- SustainedBreachRule : dépassement qui dure (alerte critique)
+
+Chaque alerte n'est émise qu'une fois par épisode de dépassement ; elle
+est réarmée quand la mesure revient dans la plage. Les règles journalières
+(daily=True, ex: mortalité du jour) sont aussi réarmées chaque jour : une
+mortalité anormale qui dure une semaine donne une alerte par jour. La date
+de la dedup_key est celle de l'émission (début de l'épisode, ou jour de la
+règle journalière).
+"""
+from collections import deque
+from datetime import timedelta
+
+from .constants import (
+    ABNORMAL_DAILY_MORTALITY_RATE,
+    MAX_HOURLY_CHANGE,
+    OPTIMAL_PARAMETERS,
+    SUSTAINED_BREACH_MINUTES,
+    WATER_QUALITY_FIELDS,
+)
+
+SEVERITY_WARNING = 'warning'
+SEVERITY_CRITICAL = 'critical'
+
+
+class Rule:
+    """
+    Règle d'alerte sur un paramètre mesuré.
+
+    evaluate() reçoit l'état du paramètre pour le cycle et renvoie un
+    message d'alerte, ou None si la mesure est normale.
+    """
+
+    code = None
+    severity = SEVERITY_WARNING
+    daily = False
+
+    def __init__(self, metric):
+        self.metric = metric
+
+    def evaluate(self, state, timestamp, value):
+        raise NotImplementedError
+
+
+class ThresholdRule(Rule):
+    """
+    Valeur hors de la plage [minimum, maximum] (bornes optionnelles).
+
+    daily=True pour une mesure journalière : l'alerte est réémise chaque
+    jour tant que le dépassement dure.
+    """
+
+    code = 'threshold'
+
+    def __init__(self, metric, minimum=None, maximum=None, daily=False):
+        super().__init__(metric)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.daily = daily
+
+    def is_breached(self, value):
+        return (
+            (self.minimum is not None and value < self.minimum)
+            or (self.maximum is not None and value > self.maximum)
+        )
+
+    def evaluate(self, state, timestamp, value):
+        if self.is_breached(value):
+            return f"{self.metric} hors plage ({value}, plage {self.minimum}-{self.maximum})"
+        return None
+
+
+class SustainedBreachRule(ThresholdRule):
+    """Valeur hors plage sans interruption depuis au moins `duration`."""
+
+    code = 'sustained'
+    severity = SEVERITY_CRITICAL
+
+    def __init__(self, metric, minimum=None, maximum=None, duration=timedelta(minutes=SUSTAINED_BREACH_MINUTES)):
+        super().__init__(metric, minimum, maximum)
+        self.duration = duration
+
+    def evaluate(self, state, timestamp, value):
+        if not self.is_breached(value):
+            state.breach_started_at.pop(self.code, None)
+            return None
+
+        started_at = state.breach_started_at.setdefault(self.code, timestamp)
+        if timestamp - started_at >= self.duration:
+            return f"{self.metric} hors plage depuis {timestamp - started_at} ({value})"
+        return None
+
+
+class RateOfChangeRule(Rule):
+    """Variation supérieure à `max_hourly_change` par heure sur la fenêtre glissante."""
+
+    code = 'rate_of_change'
+
+    def __init__(self, metric, max_hourly_change):
+        super().__init__(metric)
+        self.max_hourly_change = max_hourly_change
+
+    def evaluate(self, state, timestamp, value):
+        for previous_timestamp, previous_value in state.window:
+            hours = (timestamp - previous_timestamp).total_seconds() / 3600
+            if hours > 0 and abs(value - previous_value) / hours > self.max_hourly_change:
+                return f"{self.metric} varie trop vite ({previous_value} -> {value})"
+        return None
+
+
+class MetricState:
+    """
+    État glissant d'un paramètre pour un cycle.
+
+    window : mesures récentes (horodatage, valeur) dans la fenêtre
+    breach_started_at : début du dépassement en cours par règle
+    active : règles déjà en alerte pour l'épisode courant, avec le jour
+        de la dernière alerte
+    """
+
+    __slots__ = ('window', 'breach_started_at', 'active')
+
+    def __init__(self):
+        self.window = deque()
+        self.breach_started_at = {}
+        self.active = {}
+
+
+def default_rules(species):
+    """
+    Règles par défaut d'une espèce, construites depuis OPTIMAL_PARAMETERS.
+
+    Toutes les espèces ont la règle de mortalité anormale ; les règles de
+    qualité d'eau ne s'appliquent qu'aux espèces dont les plages sont connues.
+    """
+    rules = [ThresholdRule('mortality_rate', maximum=ABNORMAL_DAILY_MORTALITY_RATE, daily=True)]
+    for metric, bounds in OPTIMAL_PARAMETERS.get(species, {}).items():
+        if not isinstance(bounds, tuple):
+            continue
+        minimum, maximum = bounds
+        rules.append(ThresholdRule(metric, minimum, maximum))
+        rules.append(SustainedBreachRule(metric, minimum, maximum))
+        if metric in MAX_HOURLY_CHANGE:
+            rules.append(RateOfChangeRule(metric, MAX_HOURLY_CHANGE[metric]))
+    return rules
+
+
+def readings_from_log(log, fish_count=None):
+    """
+    Extrait les mesures d'un CycleLog (ou dictionnaire équivalent).
+
+    La mortalité saisie (mortality_count) est convertie en taux journalier
+    (% de l'effectif) pour la règle de mortalité anormale.
+
+    Args:
+        log: CycleLog ou dictionnaire
+        fish_count (int): effectif du cycle (actuel, ou initial à défaut) ;
+            sans effectif connu, la mortalité n'est pas évaluée
+
+    Returns:
+        dict: {paramètre: valeur} pour les champs renseignés
+    """
+    get = log.get if isinstance(log, dict) else lambda field: getattr(log, field, None)
+    readings = {}
+    for field, metric in WATER_QUALITY_FIELDS.items():
+        value = get(field)
+        if value is not None:
+            readings[metric] = float(value)
+
+    mortality_count = get('mortality_count')
+    if mortality_count is not None and fish_count:
+        readings['mortality_rate'] = float(mortality_count) / float(fish_count) * 100
+    return readings
+
+
+class AlertEngine:
+    """
+    Évalue les règles au fil des mesures, avec un état par cycle en mémoire.
+
+    Args:
+        rules_for_species: fonction espèce -> liste de règles
+        window (timedelta): profondeur de la fenêtre glissante
+        emit: fonction appelée avec la liste des nouvelles alertes
+            (ex: création des notifications dédupliquées)
+    """
+
+    def __init__(self, rules_for_species=default_rules, window=timedelta(hours=6), emit=None):
+        self.rules_for_species = rules_for_species
+        self.window = window
+        self.emit = emit
+        self._rules = {}
+        self._states = {}
+
+    def _species_rules(self, species):
+        if species not in self._rules:
+            rules = {}
+            for rule in self.rules_for_species(species):
+                rules.setdefault(rule.metric, []).append(rule)
+            self._rules[species] = rules
+        return self._rules[species]
+
+    def process(self, cycle_id, species, timestamp, readings):
+        """
+        Évalue les mesures d'un cycle à un instant donné.
+
+        Args:
+            cycle_id: identifiant du cycle
+            species (str): espèce du cycle
+            timestamp (datetime): instant de la mesure
+            readings (dict): {paramètre: valeur}
+
+        Returns:
+            list: nouvelles alertes (dictionnaires)
+        """
+        alerts = []
+        rules_by_metric = self._species_rules(species)
+
+        for metric, value in readings.items():
+            rules = rules_by_metric.get(metric)
+            if not rules or value is None:
+                continue
+
+            state = self._states.setdefault((cycle_id, metric), MetricState())
+            while state.window and timestamp - state.window[0][0] > self.window:
+                state.window.popleft()
+
+            for rule in rules:
+                message = rule.evaluate(state, timestamp, value)
+                if message is None:
+                    state.active.pop(rule.code, None)
+                    continue
+                alerted_on = state.active.get(rule.code)
+                if alerted_on is None or (rule.daily and alerted_on != timestamp.date()):
+                    state.active[rule.code] = timestamp.date()
+                    alerts.append({
+                        'cycle_id': cycle_id,
+                        'metric': metric,
+                        'rule': rule.code,
+                        'severity': rule.severity,
+                        'value': value,
+                        'timestamp': timestamp,
+                        'message': message,
+                        'dedup_key': f"{cycle_id}:{metric}:{rule.code}:{timestamp.date().isoformat()}",
+                    })
+
+            state.window.append((timestamp, value))
+
+        if alerts and self.emit:
+            self.emit(alerts)
+        return alerts
+
+    def process_batch(self, events):
+        """
+        Évalue un lot de mesures (ex: logs arrivés par synchronisation).
+
+        Les événements sont triés par cycle puis par date pour que l'état
+        glissant suive l'ordre réel des mesures, et les alertes sont émises
+        en un seul appel.
+
+        Args:
+            events: itérable de (cycle_id, species, timestamp, readings)
+
+        Returns:
+            list: nouvelles alertes
+        """
+        emit, self.emit = self.emit, None
+        try:
+            alerts = []
+            for cycle_id, species, timestamp, readings in sorted(events, key=lambda event: (str(event[0]), event[2])):
+                alerts.extend(self.process(cycle_id, species, timestamp, readings))
+        finally:
+            self.emit = emit
+
+        if alerts and self.emit:
+            self.emit(alerts)
+        return alerts
+
+    def forget(self, cycle_id):
+        """Libère l'état d'un cycle terminé (récolte, annulation)."""
+        for key in [key for key in self._states if key[0] == cycle_id]:
+            del self._states[key]
@@ -0,0 +1,255 @@
+"""
+Formules métier du module aquaculture.
+
+Deux implémentations des mêmes formules du cahier des charges :
+- AquacultureCalculator : calcul scalaire en Decimal, un cycle à la fois
+  (saisies quotidiennes, écrans de détail d'un cycle).
+- BatchAquacultureCalculator : calcul vectorisé NumPy sur des colonnes de
+  valeurs (recalcul des tableaux de bord de tous les cycles d'une région).
+"""
+import math
+from decimal import Decimal
+
+import numpy as np
+
+from .guide_index import get_guide_index
+
+
+class AquacultureCalculator:
+    """
+    Centralise tous les calculs métier selon les formules du cahier des charges.
+    """
+
+    @staticmethod
+    def calculate_biomass(fish_count: int, average_weight: Decimal) -> Decimal:
+        """
+        Calcule la biomasse totale.
+        Biomasse = Nombre de poissons × Poids moyen
+        """
+        return Decimal(fish_count) * average_weight
+
+    @staticmethod
+    def calculate_survival_rate(initial_count: int, current_count: int) -> Decimal:
+        """
+        Taux de survie (TS).
+        TS (%) = (Nombre final / Nombre initial) × 100
+        """
+        if initial_count == 0:
+            return Decimal('0')
+        return (Decimal(current_count) / Decimal(initial_count)) * 100
+
+    @staticmethod
+    def calculate_fcr(feed_consumed: Decimal, weight_gain: Decimal) -> Decimal:
+        """
+        Indice de Consommation (Feed Conversion Ratio).
+        IC = Quantité d'aliment distribuée (g) / Gain de poids (g)
+        """
+        if weight_gain <= 0:
+            return Decimal('0')
+        return feed_consumed / weight_gain
+
+    @staticmethod
+    def calculate_daily_growth_rate(initial_weight: Decimal, final_weight: Decimal, days: int) -> Decimal:
+        """
+        Gain de poids moyen journalier.
+        GPM = (Poids final - Poids initial) / Nombre de jours
+        """
+        if days == 0:
+            return Decimal('0')
+        return (final_weight - initial_weight) / Decimal(days)
+
+    @staticmethod
+    def calculate_specific_growth_rate(initial_weight: Decimal, final_weight: Decimal, days: int) -> Decimal:
+        """
+        Taux de Croissance Spécifique (TCS).
+        TCS (%/j) = ([ln(poids final) - ln(poids initial)] / jours) × 100
+        """
+        if days == 0 or initial_weight <= 0 or final_weight <= 0:
+            return Decimal('0')
+
+        ln_final = math.log(float(final_weight))
+        ln_initial = math.log(float(initial_weight))
+        return Decimal((ln_final - ln_initial) / days * 100)
+
+    @staticmethod
+    def calculate_condition_factor(weight_g: Decimal, length_cm: Decimal) -> Decimal:
+        """
+        Facteur de Condition K.
+        K = (P / L³) × 100
+        où P = poids en grammes, L = longueur en cm
+        """
+        if length_cm <= 0:
+            return Decimal('0')
+        return (weight_g / (length_cm ** 3)) * 100
+
+    @staticmethod
+    def suggest_feed_amount(biomass: Decimal, feeding_rate_percentage: Decimal) -> Decimal:
+        """
+        Calcule la quantité d'aliment journalière recommandée.
+        Aliment/jour = Biomasse × (Taux d'alimentation / 100)
+        """
+        return biomass * (feeding_rate_percentage / 100)
+
+    @staticmethod
+    def get_growth_stage(species: str, weight: Decimal) -> str:
+        """
+        Détermine le stade de croissance selon l'espèce et le poids.
+
+        Les plages de poids viennent de l'index en mémoire du guide
+        nutritionnel (aucune requête en base).
+        """
+        return get_guide_index().get_growth_stage(species, weight) or 'croissance'  # Par défaut
+
+
+class BatchAquacultureCalculator:
+    """
+    Version vectorisée d'AquacultureCalculator pour les recalculs en masse.
+
+    Métier : Recalculer les tableaux de bord de tous les cycles d'une région
+    représente des millions d'opérations Decimal en Python. Ici chaque formule
+    prend des colonnes (listes ou tableaux NumPy, 1D par cycle ou 2D
+    cycles × jours) et calcule toutes les valeurs en une seule opération.
+
+    Les gardes des formules scalaires (division par zéro, poids négatifs...)
+    sont appliquées par masques : les positions concernées valent 0, comme
+    le Decimal('0') renvoyé par la version scalaire.
+
+    Tolérance : les résultats sont en float64. Ils sont identiques aux
+    formules scalaires à RELATIVE_TOLERANCE près (ABSOLUTE_TOLERANCE pour
+    les valeurs proches de zéro).
+    """
+
+    RELATIVE_TOLERANCE = 1e-9
+    ABSOLUTE_TOLERANCE = 1e-9
+
+    @staticmethod
+    def _as_float_array(values) -> np.ndarray:
+        return np.asarray(values, dtype=np.float64)
+
+    @staticmethod
+    def _safe_divide(numerator: np.ndarray, denominator: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Division élément par élément, 0 là où le masque est faux."""
+        numerator, denominator, mask = np.broadcast_arrays(numerator, denominator, mask)
+        result = np.zeros(numerator.shape, dtype=np.float64)
+        np.divide(numerator, denominator, out=result, where=mask)
+        return result
+
+    @staticmethod
+    def calculate_days(start_dates, end_dates) -> np.ndarray:
+        """
+        Nombre de jours entre deux colonnes de dates.
+
+        Args:
+            start_dates: dates de début (date, chaîne ISO ou datetime64)
+            end_dates: dates de fin (même format)
+
+        Returns:
+            np.ndarray: nombre de jours (entiers)
+        """
+        start = np.asarray(start_dates, dtype='datetime64[D]')
+        end = np.asarray(end_dates, dtype='datetime64[D]')
+        return (end - start).astype(np.int64)
+
+    @classmethod
+    def calculate_biomass(cls, fish_counts, average_weights) -> np.ndarray:
+        """Biomasse = Nombre de poissons × Poids moyen"""
+        return cls._as_float_array(fish_counts) * cls._as_float_array(average_weights)
+
+    @classmethod
+    def calculate_survival_rate(cls, initial_counts, current_counts) -> np.ndarray:
+        """TS (%) = (Nombre final / Nombre initial) × 100, 0 si effectif initial nul."""
+        initial = cls._as_float_array(initial_counts)
+        current = cls._as_float_array(current_counts)
+        return cls._safe_divide(current, initial, initial != 0) * 100
+
+    @classmethod
+    def calculate_fcr(cls, feed_consumed, weight_gain) -> np.ndarray:
+        """IC = Aliment distribué / Gain de poids, 0 si gain nul ou négatif."""
+        feed = cls._as_float_array(feed_consumed)
+        gain = cls._as_float_array(weight_gain)
+        return cls._safe_divide(feed, gain, gain > 0)
+
+    @classmethod
+    def calculate_daily_growth_rate(cls, initial_weights, final_weights, days) -> np.ndarray:
+        """GPM = (Poids final - Poids initial) / Jours, 0 si durée nulle."""
+        initial = cls._as_float_array(initial_weights)
+        final = cls._as_float_array(final_weights)
+        days = cls._as_float_array(days)
+        return cls._safe_divide(final - initial, days, days != 0)
+
+    @classmethod
+    def calculate_specific_growth_rate(cls, initial_weights, final_weights, days) -> np.ndarray:
+        """
+        TCS (%/j) = ([ln(poids final) - ln(poids initial)] / jours) × 100,
+        0 si durée nulle ou poids négatif/nul.
+        """
+        initial = cls._as_float_array(initial_weights)
+        final = cls._as_float_array(final_weights)
+        days = cls._as_float_array(days)
+        initial, final, days = np.broadcast_arrays(initial, final, days)
+
+        valid = (days != 0) & (initial > 0) & (final > 0)
+        log_ratio = np.zeros(initial.shape, dtype=np.float64)
+        np.log(final, out=log_ratio, where=valid)
+        log_initial = np.zeros(initial.shape, dtype=np.float64)
+        np.log(initial, out=log_initial, where=valid)
+        log_ratio -= log_initial
+
+        return cls._safe_divide(log_ratio, days, valid) * 100
+
+    @classmethod
+    def calculate_condition_factor(cls, weights_g, lengths_cm) -> np.ndarray:
+        """K = (P / L³) × 100, 0 si longueur nulle ou négative."""
+        weights = cls._as_float_array(weights_g)
+        lengths = cls._as_float_array(lengths_cm)
+        return cls._safe_divide(weights, lengths ** 3, lengths > 0) * 100
+
+    @classmethod
+    def suggest_feed_amount(cls, biomass, feeding_rate_percentage) -> np.ndarray:
+        """Aliment/jour = Biomasse × (Taux d'alimentation / 100)"""
+        return cls._as_float_array(biomass) * (cls._as_float_array(feeding_rate_percentage) / 100)
+
+    @classmethod
+    def calculate_cycle_metrics(cls, initial_counts, current_counts, initial_weights,
+                                current_weights, feed_consumed, start_dates, end_dates,
+                                lengths_cm=None) -> dict:
+        """
+        Calcule toutes les métriques d'un lot de cycles en une passe.
+
+        Chaque argument est une colonne alignée (même position = même cycle).
+        Le gain de poids utilisé pour l'IC est celui de la biomasse, comme
+        lors de la récolte d'un cycle.
+
+        Args:
+            initial_counts: effectifs initiaux
+            current_counts: effectifs actuels (ou finaux)
+            initial_weights: poids moyens initiaux (g)
+            current_weights: poids moyens actuels (g)
+            feed_consumed: aliment distribué cumulé (même unité que la biomasse)
+            start_dates: dates de début de cycle
+            end_dates: dates de fin (ou date du calcul pour les cycles actifs)
+            lengths_cm: longueurs standard (cm), optionnel pour le facteur K
+
+        Returns:
+            dict: colonnes NumPy 'days', 'initial_biomass', 'current_biomass',
+            'survival_rate', 'fcr', 'daily_growth_rate', 'specific_growth_rate'
+            et 'condition_factor' si les longueurs sont fournies
+        """
+        days = cls.calculate_days(start_dates, end_dates)
+        initial_biomass = cls.calculate_biomass(initial_counts, initial_weights)
+        current_biomass = cls.calculate_biomass(current_counts, current_weights)
+
+        metrics = {
+            'days': days,
+            'initial_biomass': initial_biomass,
+            'current_biomass': current_biomass,
+            'survival_rate': cls.calculate_survival_rate(initial_counts, current_counts),
+            'fcr': cls.calculate_fcr(feed_consumed, current_biomass - initial_biomass),
+            'daily_growth_rate': cls.calculate_daily_growth_rate(initial_weights, current_weights, days),
+            'specific_growth_rate': cls.calculate_specific_growth_rate(initial_weights, current_weights, days),
+        }
+
+        if lengths_cm is not None:
+            metrics['condition_factor'] = cls.calculate_condition_factor(current_weights, lengths_cm)
+
+        return metrics
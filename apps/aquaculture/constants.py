@@ -0,0 +1,68 @@
+"""
+Constantes métier pour le module aquaculture (Phase 2).
+
+Valeurs provisoires issues du guide d'implémentation : elles changeront
+en fonction des données fournies par MAVECAM.
+"""
+
+# Espèces élevées
+SPECIES_CHOICES = [
+    ('tilapia', 'Tilapia'),
+    ('clarias', 'Clarias (Silure)'),
+    ('carpe', 'Carpe'),
+    ('heterotis', 'Heterotis'),
+    ('parachanna', 'Parachanna'),
+]
+
+# Stades de croissance
+GROWTH_STAGES = [
+    ('alevin', 'Alevin (0-10g)'),
+    ('juvenile', 'Juvénile (10-50g)'),
+    ('croissance', 'Croissance (50-150g)'),
+    ('finition', 'Finition (>150g)'),
+]
+
+# Paramètres optimaux par espèce
+OPTIMAL_PARAMETERS = {
+    'tilapia': {
+        'temperature': (25, 32),  # °C
+        'oxygen': (5, 8),         # mg/L
+        'ph': (6.5, 8.5),
+        'density_kg_m3': 30,      # kg/m³
+    },
+    'clarias': {
+        'temperature': (25, 30),
+        'oxygen': (3, 7),
+        'ph': (6.5, 8),
+        'density_kg_m3': 50,
+    },
+}
+
+# Plages de poids (g) par stade : [min, max[, max None = sans limite.
+# Utilisées tant que le guide nutritionnel MAVECAM n'est pas chargé en base.
+GROWTH_STAGE_WEIGHT_RANGES = {
+    'alevin': (0, 10),
+    'juvenile': (10, 50),
+    'croissance': (50, 150),
+    'finition': (150, None),
+}
+
+# Correspondance champs CycleLog -> paramètres de OPTIMAL_PARAMETERS
+WATER_QUALITY_FIELDS = {
+    'water_temperature': 'temperature',
+    'dissolved_oxygen': 'oxygen',
+    'ph_level': 'ph',
+}
+
+# Variations maximales tolérées par heure avant alerte (valeurs provisoires)
+MAX_HOURLY_CHANGE = {
+    'temperature': 2,  # °C/h
+    'oxygen': 2,       # mg/L/h
+    'ph': 0.5,
+}
+
+# Durée (minutes) hors plage optimale avant alerte critique
+SUSTAINED_BREACH_MINUTES = 120
+
+# Mortalité journalière anormale (% de l'effectif)
+ABNORMAL_DAILY_MORTALITY_RATE = 2
@@ -0,0 +1,143 @@
+"""
+Réduction des séries de graphiques pour l'application mobile.
+
+Métier : Les courbes de CycleMetrics (croissance, survie, aliment cumulé)
+grandissent d'un point par jour de cycle. Les écrans de téléphone n'affichent
+que quelques centaines de pixels : on renvoie une série réduite qui conserve
+la forme de la courbe (algorithme LTTB - Largest Triangle Three Buckets).
+"""
+from datetime import date
+
+import numpy as np
+from django.core.cache import cache
+
+# Bornes du paramètre ?points= accepté par les endpoints de graphiques
+DEFAULT_CHART_POINTS = 60
+MAX_CHART_POINTS = 500
+MIN_CHART_POINTS = 3
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _x_value(value):
+    """Convertit l'abscisse d'un point (date ISO, date ou nombre) en float."""
+    if isinstance(value, str):
+        return float(date.fromisoformat(value[:10]).toordinal())
+    if isinstance(value, date):
+        return float(value.toordinal())
+    return float(value)
+
+
+def largest_triangle_three_buckets(x, y, threshold):
+    """
+    Sélectionne les indices des points à conserver selon LTTB.
+
+    Le premier et le dernier point sont toujours conservés. Les points
+    intermédiaires sont répartis en (threshold - 2) paquets ; dans chaque
+    paquet on garde le point formant le plus grand triangle avec le point
+    retenu précédemment et la moyenne du paquet suivant.
+
+    Args:
+        x: abscisses (croissantes)
+        y: ordonnées
+        threshold (int): nombre de points souhaité
+
+    Returns:
+        list: indices des points conservés, dans l'ordre
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    length = len(x)
+
+    if threshold >= length or threshold < MIN_CHART_POINTS:
+        return list(range(length))
+
+    selected = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        if next_start >= next_end:
+            next_start, next_end = length - 1, length
+        average_x = x[next_start:next_end].mean()
+        average_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - average_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (average_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected.append(previous)
+
+    selected.append(length - 1)
+    return selected
+
+
+def downsample_series(series, points, y_key, x_key='date'):
+    """
+    Réduit une série de points (liste de dictionnaires) à `points` éléments.
+
+    Les points conservés sont renvoyés tels quels (mêmes clés que la série
+    d'origine), le client n'a donc rien à adapter pour les afficher.
+
+    Args:
+        series (list): points ordonnés, ex: [{'date': '2024-01-01', 'weight': 5.0}, ...]
+        points (int): nombre maximal de points à renvoyer
+        y_key (str): clé de la valeur tracée ('weight', 'count', 'cumulative'...)
+        x_key (str): clé de l'abscisse ('date' ou 'day')
+
+    Returns:
+        list: série réduite
+    """
+    if len(series) <= points:
+        return list(series)
+
+    x = [_x_value(point[x_key]) for point in series]
+    y = [float(point[y_key]) for point in series]
+    return [series[index] for index in largest_triangle_three_buckets(x, y, points)]
+
+
+def clamp_chart_points(value):
+    """
+    Valide le paramètre ?points= d'une requête.
+
+    Returns:
+        int: nombre de points borné entre MIN_CHART_POINTS et MAX_CHART_POINTS
+    """
+    try:
+        points = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_CHART_POINTS
+    return max(MIN_CHART_POINTS, min(points, MAX_CHART_POINTS))
+
+
+def get_cached_downsampled_series(cycle_id, version, name, series, points, y_key, x_key='date'):
+    """
+    Série réduite mise en cache par cycle et version des métriques.
+
+    La version (ex: horodatage last_calculated de CycleMetrics) fait partie
+    de la clé : un recalcul des métriques invalide naturellement le cache.
+
+    Args:
+        cycle_id: identifiant du cycle
+        version: version des métriques du cycle
+        name (str): nom de la série ('growth', 'survival', 'feed')
+        series (list): série brute
+        points (int): nombre de points demandé (déjà borné)
+        y_key (str): clé de la valeur tracée
+        x_key (str): clé de l'abscisse
+
+    Returns:
+        list: série réduite
+    """
+    cache_key = f'chart:{cycle_id}:{version}:{name}:{points}'
+    downsampled = cache.get(cache_key)
+    if downsampled is None:
+        downsampled = downsample_series(series, points, y_key, x_key)
+        cache.set(cache_key, downsampled, CACHE_TIMEOUT)
+    return downsampled
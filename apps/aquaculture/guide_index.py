@@ -0,0 +1,166 @@
+"""
+Index en mémoire du guide nutritionnel.
+
+Métier : Chaque plan d'alimentation doit trouver la ligne du guide
+correspondant à l'espèce et au poids moyen du cycle. Plutôt qu'une requête
+par plan, le guide (quelques dizaines de lignes) est chargé une fois par
+processus dans un index trié par poids, interrogé par recherche dichotomique.
+
+L'index est invalidé par un numéro de version stocké dans le cache partagé
+(CACHES) : la sauvegarde d'une ligne du guide appelle invalidate_guide_index()
+et chaque processus reconstruit son index au prochain accès. La version
+n'est relue qu'une fois toutes les GUIDE_VERSION_CHECK_SECONDS secondes,
+une modification du guide atteint donc les autres processus avec ce délai.
+"""
+import time
+from bisect import bisect_right
+
+from django.core.cache import cache
+
+from .constants import GROWTH_STAGE_WEIGHT_RANGES, SPECIES_CHOICES
+
+GUIDE_VERSION_CACHE_KEY = 'aquaculture:nutritional_guide:version'
+GUIDE_VERSION_CHECK_SECONDS = 30
+
+_index = None
+_index_version = None
+_version_checked_at = None
+
+
+def _row_value(row, field):
+    """Lit un champ d'une ligne du guide (dictionnaire ou instance de modèle)."""
+    if isinstance(row, dict):
+        return row.get(field)
+    return getattr(row, field, None)
+
+
+class NutritionalGuideIndex:
+    """
+    Index par espèce des plages de poids du guide nutritionnel.
+
+    Chaque espèce a une liste de lignes triées par min_weight ; une plage
+    couvre [min_weight, max_weight[ et max_weight None signifie sans limite.
+    Un poids hors des plages connues est rattaché à la première ou à la
+    dernière plage de l'espèce.
+    """
+
+    def __init__(self, rows):
+        by_species = {}
+        for row in rows:
+            by_species.setdefault(_row_value(row, 'species'), []).append(row)
+
+        self._min_weights = {}
+        self._rows = {}
+        for species, species_rows in by_species.items():
+            species_rows.sort(key=lambda row: _row_value(row, 'min_weight'))
+            self._rows[species] = species_rows
+            self._min_weights[species] = [_row_value(row, 'min_weight') for row in species_rows]
+
+    def __contains__(self, species):
+        return species in self._rows
+
+    def lookup(self, species, weight):
+        """
+        Trouve la ligne du guide pour une espèce et un poids moyen.
+
+        Args:
+            species (str): code espèce (SPECIES_CHOICES)
+            weight: poids moyen en grammes
+
+        Returns:
+            La ligne du guide (dictionnaire ou instance), ou None si
+            l'espèce est inconnue ou si le poids tombe entre deux plages
+        """
+        rows = self._rows.get(species)
+        if not rows:
+            return None
+
+        position = bisect_right(self._min_weights[species], weight) - 1
+        if position < 0:
+            return rows[0]
+
+        row = rows[position]
+        max_weight = _row_value(row, 'max_weight')
+        if max_weight is None or weight < max_weight or position == len(rows) - 1:
+            return row
+        return None
+
+    def get_growth_stage(self, species, weight):
+        """
+        Stade de croissance d'une espèce pour un poids moyen.
+
+        Returns:
+            str: code du stade (GROWTH_STAGES) ou None si introuvable
+        """
+        row = self.lookup(species, weight)
+        return _row_value(row, 'growth_stage') if row is not None else None
+
+
+def load_guide_rows():
+    """
+    Charge les lignes du guide nutritionnel.
+
+    En attendant le modèle NutritionalGuide (données MAVECAM), chaque espèce
+    utilise les plages de poids génériques des stades de croissance.
+
+    Returns:
+        list: lignes {species, growth_stage, min_weight, max_weight}
+    """
+    return [
+        {
+            'species': species,
+            'growth_stage': stage,
+            'min_weight': min_weight,
+            'max_weight': max_weight,
+        }
+        for species, _label in SPECIES_CHOICES
+        for stage, (min_weight, max_weight) in GROWTH_STAGE_WEIGHT_RANGES.items()
+    ]
+
+
+def get_guide_version():
+    """Version courante du guide, partagée entre processus via le cache."""
+    return cache.get_or_set(GUIDE_VERSION_CACHE_KEY, 1, None)
+
+
+def invalidate_guide_index():
+    """
+    Signale une modification du guide à tous les processus.
+
+    À appeler après la sauvegarde ou la suppression d'une ligne du guide.
+    Le processus courant relit la version dès son prochain accès.
+    """
+    global _version_checked_at
+
+    try:
+        cache.incr(GUIDE_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(GUIDE_VERSION_CACHE_KEY, 2, None)
+    _version_checked_at = None
+
+
+def get_guide_index():
+    """
+    Index du guide pour le processus courant, reconstruit si la version a changé.
+
+    La version n'est lue dans le cache qu'au plus une fois toutes les
+    GUIDE_VERSION_CHECK_SECONDS secondes.
+
+    Returns:
+        NutritionalGuideIndex: index à jour
+    """
+    global _index, _index_version, _version_checked_at
+
+    now = time.monotonic()
+    if (
+        _index is not None and _version_checked_at is not None
+        and now - _version_checked_at < GUIDE_VERSION_CHECK_SECONDS
+    ):
+        return _index
+
+    version = get_guide_version()
+    _version_checked_at = now
+    if _index is None or version != _index_version:
+        _index = NutritionalGuideIndex(load_guide_rows())
+        _index_version = version
+    return _index
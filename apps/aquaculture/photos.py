@@ -0,0 +1,116 @@
+"""
+Traitement des photos du journal sanitaire.
+
+Métier : Les photos d'un SanitaryLog sont consultées surtout dans des
+listes sur mobile ; télécharger l'original (1280×720) pour une vignette
+gaspille le forfait data des pisciculteurs. Chaque photo est donc :
+- identifiée par l'empreinte SHA-256 de son contenu : un envoi répété
+  (nouvelle tentative après coupure réseau) ne crée pas de doublon
+- nettoyée de ses métadonnées EXIF (position GPS du téléphone)
+- déclinée en WebP 'thumbnail' et 'medium' par un worker de la file de
+  travaux, hors du cycle requête/réponse
+
+Les chemins contiennent l'empreinte : un fichier ne change jamais, les
+variantes sont servies avec un cache HTTP immuable
+(/api/uploads/photos/<empreinte>/<variante>.webp).
+"""
+import hashlib
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from jobs.queue import register_job
+
+PHOTO_ROOT = 'sanitary_logs'
+
+# Tailles maximales (largeur, hauteur) par variante
+PHOTO_VARIANTS = {
+    'original': (1280, 720),
+    'medium': (640, 360),
+    'thumbnail': (240, 135),
+}
+
+WEBP_QUALITY = 80
+
+# En-tête des variantes servies par uploads.views.PhotoVariantView (contenu adressé
+# par empreinte) ; privé : l'accès est authentifié, les proxies partagés ne gardent rien
+IMMUTABLE_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+
+
+def photo_digest(fileobj):
+    """
+    Calcule l'empreinte SHA-256 d'une photo par blocs.
+
+    Returns:
+        str: empreinte hexadécimale
+    """
+    digest = hashlib.sha256()
+    fileobj.seek(0)
+    for chunk in iter(lambda: fileobj.read(64 * 1024), b''):
+        digest.update(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+def photo_path(digest, variant='original'):
+    """Chemin de stockage d'une variante : sanitary_logs/ab/abcdef.../thumbnail.webp"""
+    return f"{PHOTO_ROOT}/{digest[:2]}/{digest}/{variant}.webp"
+
+
+def render_variant(image, size):
+    """
+    Réduit une image et l'encode en WebP sans métadonnées EXIF.
+
+    L'orientation EXIF est appliquée aux pixels avant d'être supprimée,
+    pour que la photo reste dans le bon sens.
+
+    Returns:
+        bytes: image WebP
+    """
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGB')
+    image.thumbnail(size)
+
+    output = BytesIO()
+    image.save(output, format='WEBP', quality=WEBP_QUALITY)
+    return output.getvalue()
+
+
+def store_photo(fileobj, storage=default_storage, generate_variants=True):
+    """
+    Enregistre une photo envoyée, sans doublon.
+
+    Args:
+        fileobj: fichier uploadé
+        storage: stockage Django (par défaut default_storage)
+        generate_variants (bool): ajoute la génération des variantes à la file
+
+    Returns:
+        str: empreinte de la photo, à enregistrer sur le SanitaryLog
+    """
+    digest = photo_digest(fileobj)
+    path = photo_path(digest)
+
+    if not storage.exists(path):
+        with Image.open(fileobj) as image:
+            storage.save(path, ContentFile(render_variant(image, PHOTO_VARIANTS['original'])))
+        if generate_variants:
+            generate_photo_variants.enqueue(args=[digest], coalesce_key=f'photo:{digest}')
+
+    return digest
+
+
+@register_job(name='aquaculture.generate_photo_variants')
+def generate_photo_variants(digest, storage=default_storage):
+    """
+    Génère les variantes manquantes d'une photo (exécuté par run_jobs).
+    """
+    with storage.open(photo_path(digest)) as original, Image.open(original) as image:
+        image.load()
+        for variant, size in PHOTO_VARIANTS.items():
+            path = photo_path(digest, variant)
+            if variant != 'original' and not storage.exists(path):
+                storage.save(path, ContentFile(render_variant(image, size)))
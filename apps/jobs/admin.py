@@ -0,0 +1,37 @@
+from django.contrib import admin
+from .models import Job, PeriodicSchedule
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Suivi de la file de travaux par l'équipe MAVECAM.
+    """
+    list_display = (
+        'name', 'status', 'coalesce_key', 'attempts', 'run_at',
+        'locked_by', 'finished_at'
+    )
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'coalesce_key')
+    ordering = ('-created_at',)
+    readonly_fields = (
+        'attempts', 'last_error', 'locked_by', 'locked_at',
+        'created_at', 'finished_at'
+    )
+
+    actions = ['retry_jobs']
+
+    def retry_jobs(self, request, queryset):
+        """Action pour relancer les travaux échoués."""
+        count = queryset.filter(status=Job.STATUS_FAILED).update(
+            status=Job.STATUS_PENDING, attempts=0, finished_at=None
+        )
+        self.message_user(request, f'{count} travail(aux) relancé(s).')
+    retry_jobs.short_description = "Relancer les travaux échoués"
+
+
+@admin.register(PeriodicSchedule)
+class PeriodicScheduleAdmin(admin.ModelAdmin):
+    list_display = ('name', 'job_name', 'interval_seconds', 'next_run_at', 'is_active')
+    list_filter = ('is_active',)
+    search_fields = ('name', 'job_name')
@@ -0,0 +1,20 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    """
+    Configuration de l'application jobs pour MAVECAM AquaCare.
+
+    Responsabilités :
+    - File de travaux asynchrones stockée en base (sans broker Celery)
+    - Planification des travaux périodiques
+    - Exécution par la commande `manage.py run_jobs`
+    """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jobs'
+    verbose_name = 'Travaux asynchrones'
+
+    def ready(self):
+        # Chaque application déclare ses travaux dans tasks.py
+        autodiscover_modules('tasks')
@@ -0,0 +1,160 @@
+"""
+Worker de la file de travaux : `python manage.py run_jobs`.
+
+Boucle : planifications périodiques -> réservation d'un lot -> exécution
+dans un pool de threads -> statistiques de débit.
+
+Un thread de fond prolonge la réservation des travaux en cours toutes les
+JOBS_HEARTBEAT_INTERVAL secondes, pour qu'un travail long ne soit pas
+repris par un autre worker.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+
+from jobs.queue import (
+    claim_jobs, heartbeat, queue_stats, requeue_stale_jobs, run_job, schedule_periodic_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+# Attente maximale (secondes) quand la base est inaccessible
+MAX_BACKOFF_SECONDS = 60
+
+
+def _run_safely(job):
+    """
+    Exécute un travail sans laisser une erreur d'enregistrement de son
+    résultat (base verrouillée...) arrêter le worker.
+
+    Le travail reste alors 'running' et sera remis en attente par
+    requeue_stale_jobs().
+    """
+    try:
+        return run_job(job)
+    except Exception:
+        logger.exception("Résultat du travail %s (%s) non enregistré", job.id, job.name)
+        return False
+
+
+def _heartbeat_loop(worker_id, stopped):
+    """Prolonge la réservation des travaux du worker jusqu'à son arrêt."""
+    interval = getattr(settings, 'JOBS_HEARTBEAT_INTERVAL', 60)
+    try:
+        while not stopped.wait(interval):
+            try:
+                heartbeat(worker_id)
+            except DatabaseError:
+                logger.exception("Prolongation des travaux de %s impossible", worker_id)
+    finally:
+        connection.close()
+
+
+def _run_in_thread(job):
+    """Exécute un travail dans un thread du pool (connexion DB propre au thread)."""
+    try:
+        return _run_safely(job)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = "Exécute les travaux asynchrones en attente (remplace le worker Celery)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int,
+            default=getattr(settings, 'JOBS_WORKER_THREADS', 1),
+            help="Nombre de travaux exécutés en parallèle"
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=2.0,
+            help="Attente (secondes) quand la file est vide"
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Traite les travaux échus puis s'arrête (cron, tests)"
+        )
+        parser.add_argument(
+            '--max-jobs', type=int, default=0,
+            help="S'arrête après ce nombre de travaux (0 = illimité)"
+        )
+
+    def handle(self, *args, **options):
+        threads = max(1, options['threads'])
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        processed = failed = errors = 0
+        started = time.monotonic()
+        last_report = started
+
+        self.stdout.write(f"Worker {worker_id} démarré ({threads} threads)")
+
+        # Un seul thread : exécution directe (SQLite n'accepte qu'un écrivain à la fois)
+        pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+        stopped = threading.Event()
+        threading.Thread(
+            target=_heartbeat_loop, args=(worker_id, stopped), name='run_jobs-heartbeat', daemon=True
+        ).start()
+
+        try:
+            while True:
+                try:
+                    requeue_stale_jobs()
+                    schedule_periodic_jobs()
+                    jobs = claim_jobs(worker_id, limit=threads * 2)
+                except DatabaseError:
+                    # Base verrouillée ou indisponible : on réessaie plus tard
+                    # avec une attente qui double, plutôt que d'arrêter le worker
+                    errors += 1
+                    backoff = min(options['poll_interval'] * 2 ** errors, MAX_BACKOFF_SECONDS)
+                    logger.exception("File de travaux inaccessible, nouvel essai dans %.0fs", backoff)
+                    if options['once']:
+                        break
+                    time.sleep(backoff)
+                    continue
+                errors = 0
+
+                for succeeded in self._execute(pool, jobs):
+                    processed += 1
+                    failed += 0 if succeeded else 1
+
+                now = time.monotonic()
+                if jobs and (now - last_report >= 10 or options['once']):
+                    self._report(processed, failed, now - started)
+                    last_report = now
+
+                if options['max_jobs'] and processed >= options['max_jobs']:
+                    break
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+        finally:
+            stopped.set()
+            if pool:
+                pool.shutdown()
+
+        self._report(processed, failed, time.monotonic() - started)
+        self.stdout.write(f"File : {queue_stats()}")
+
+    def _execute(self, pool, jobs):
+        """Exécute un lot de travaux, dans le pool de threads s'il existe."""
+        if pool is None:
+            return [_run_safely(job) for job in jobs]
+        return list(pool.map(_run_in_thread, jobs))
+
+    def _report(self, processed, failed, elapsed):
+        """Affiche le débit du worker depuis son démarrage."""
+        throughput = processed / elapsed if elapsed > 0 else 0
+        self.stdout.write(
+            f"{processed} travaux traités ({failed} en échec) en {elapsed:.1f}s "
+            f"- {throughput:.1f} travaux/s"
+        )
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:22
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PeriodicSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Nom de la planification')),
+                ('job_name', models.CharField(max_length=200, verbose_name='Nom du travail')),
+                ('kwargs', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Arguments nommés')),
+                ('interval_seconds', models.PositiveIntegerField(verbose_name='Intervalle (secondes)')),
+                ('next_run_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Prochaine exécution')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Active')),
+            ],
+            options={
+                'verbose_name': 'Planification périodique',
+                'verbose_name_plural': 'Planifications périodiques',
+                'db_table': 'jobs_periodic_schedule',
+            },
+        ),
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Nom sous lequel la fonction est enregistrée (register_job)', max_length=200, verbose_name='Nom du travail')),
+                ('args', models.JSONField(blank=True, default=list, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Arguments')),
+                ('kwargs', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Arguments nommés')),
+                ('coalesce_key', models.CharField(blank=True, help_text="Un seul travail en attente et un seul en cours par clé (ex: recalcul d'un cycle)", max_length=200, null=True, verbose_name='Clé de regroupement')),
+                ('status', models.CharField(choices=[('pending', 'En attente'), ('running', 'En cours'), ('done', 'Terminé'), ('failed', 'Échoué')], default='pending', max_length=10, verbose_name='Statut')),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Date avant laquelle le travail ne doit pas être exécuté (planification, reprise)', verbose_name='Exécuter à partir de')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Tentatives')),
+                ('max_attempts', models.PositiveIntegerField(default=5, verbose_name='Tentatives maximum')),
+                ('last_error', models.TextField(blank=True, verbose_name='Dernière erreur')),
+                ('locked_by', models.CharField(blank=True, help_text='Identifiant du worker qui exécute le travail', max_length=100, verbose_name='Worker')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Réclamé le')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date de création')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Terminé le')),
+            ],
+            options={
+                'verbose_name': 'Travail asynchrone',
+                'verbose_name_plural': 'Travaux asynchrones',
+                'db_table': 'jobs_job',
+                'ordering': ['run_at'],
+                'indexes': [models.Index(fields=['status', 'run_at'], name='jobs_status_run_at_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('coalesce_key',), name='jobs_unique_pending_coalesce_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,176 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class Job(models.Model):
+    """
+    Travail asynchrone en attente ou en cours d'exécution.
+
+    Métier : Les calculs lourds (recalcul des métriques d'un cycle,
+    génération des rappels) sortent du cycle requête/réponse sans broker :
+    la table sert de file, réclamée par les workers `run_jobs`.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _('En attente')),
+        (STATUS_RUNNING, _('En cours')),
+        (STATUS_DONE, _('Terminé')),
+        (STATUS_FAILED, _('Échoué')),
+    ]
+
+    name = models.CharField(
+        _('Nom du travail'),
+        max_length=200,
+        help_text=_('Nom sous lequel la fonction est enregistrée (register_job)')
+    )
+
+    args = models.JSONField(
+        _('Arguments'),
+        default=list,
+        blank=True,
+        encoder=DjangoJSONEncoder
+    )
+
+    kwargs = models.JSONField(
+        _('Arguments nommés'),
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder
+    )
+
+    coalesce_key = models.CharField(
+        _('Clé de regroupement'),
+        max_length=200,
+        null=True,
+        blank=True,
+        help_text=_('Un seul travail en attente et un seul en cours par clé (ex: recalcul d\'un cycle)')
+    )
+
+    status = models.CharField(
+        _('Statut'),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING
+    )
+
+    run_at = models.DateTimeField(
+        _('Exécuter à partir de'),
+        default=timezone.now,
+        help_text=_('Date avant laquelle le travail ne doit pas être exécuté (planification, reprise)')
+    )
+
+    attempts = models.PositiveIntegerField(
+        _('Tentatives'),
+        default=0
+    )
+
+    max_attempts = models.PositiveIntegerField(
+        _('Tentatives maximum'),
+        default=5
+    )
+
+    last_error = models.TextField(
+        _('Dernière erreur'),
+        blank=True
+    )
+
+    locked_by = models.CharField(
+        _('Worker'),
+        max_length=100,
+        blank=True,
+        help_text=_('Identifiant du worker qui exécute le travail')
+    )
+
+    locked_at = models.DateTimeField(
+        _('Réclamé le'),
+        null=True,
+        blank=True
+    )
+
+    created_at = models.DateTimeField(
+        _('Date de création'),
+        auto_now_add=True
+    )
+
+    finished_at = models.DateTimeField(
+        _('Terminé le'),
+        null=True,
+        blank=True
+    )
+
+    class Meta:
+        app_label = 'jobs'
+        verbose_name = _('Travail asynchrone')
+        verbose_name_plural = _('Travaux asynchrones')
+        db_table = 'jobs_job'
+        ordering = ['run_at']
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='jobs_status_run_at_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['coalesce_key'],
+                condition=models.Q(status='pending'),
+                name='jobs_unique_pending_coalesce_key',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
+
+
+class PeriodicSchedule(models.Model):
+    """
+    Planification d'un travail récurrent (remplace Celery Beat).
+
+    Exemple : rappels de nourrissage toutes les heures, plans
+    d'alimentation chaque semaine.
+    """
+
+    name = models.CharField(
+        _('Nom de la planification'),
+        max_length=100,
+        unique=True
+    )
+
+    job_name = models.CharField(
+        _('Nom du travail'),
+        max_length=200
+    )
+
+    kwargs = models.JSONField(
+        _('Arguments nommés'),
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder
+    )
+
+    interval_seconds = models.PositiveIntegerField(
+        _('Intervalle (secondes)')
+    )
+
+    next_run_at = models.DateTimeField(
+        _('Prochaine exécution'),
+        default=timezone.now
+    )
+
+    is_active = models.BooleanField(
+        _('Active'),
+        default=True
+    )
+
+    class Meta:
+        app_label = 'jobs'
+        verbose_name = _('Planification périodique')
+        verbose_name_plural = _('Planifications périodiques')
+        db_table = 'jobs_periodic_schedule'
+
+    def __str__(self):
+        return f"{self.name} - {self.job_name} ({self.interval_seconds}s)"
@@ -0,0 +1,323 @@
+"""
+File de travaux asynchrones stockée en base.
+
+Remplace Celery pour les déploiements sans broker :
+- register_job : déclare une fonction exécutable par les workers
+  (même usage que @shared_task : `ma_fonction.delay(cycle_id)`)
+- enqueue : ajoute un travail, regroupé par coalesce_key si fournie
+- claim_jobs : réserve des travaux pour un worker avec
+  SELECT ... FOR UPDATE SKIP LOCKED (PostgreSQL), ou par mise à jour
+  conditionnelle sur SQLite
+- run_job : exécute un travail avec reprises et délai exponentiel
+- heartbeat : prolonge la réservation des travaux en cours d'un worker
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Exists, F, OuterRef
+from django.utils import timezone
+
+from mavecam_api.db_router import primary_reads
+
+from .models import Job, PeriodicSchedule
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+# Essais de création d'un travail regroupé en concurrence avec d'autres processus
+ENQUEUE_ATTEMPTS = 3
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def register_job(func=None, *, name=None, max_attempts=None):
+    """
+    Décorateur qui enregistre une fonction comme travail asynchrone.
+
+    La fonction décorée reste appelable directement et gagne :
+    - `.delay(*args, **kwargs)` : ajoute le travail à la file
+    - `.enqueue(args=..., kwargs=..., coalesce_key=..., run_at=...)`
+
+    Args:
+        name (str): nom du travail, par défaut `module.fonction`
+        max_attempts (int): tentatives avant abandon
+    """
+    def decorator(function):
+        job_name = name or f"{function.__module__}.{function.__name__}"
+        _registry[job_name] = function
+
+        def enqueue_job(args=(), kwargs=None, coalesce_key=None, run_at=None):
+            return enqueue(
+                job_name, args=args, kwargs=kwargs, coalesce_key=coalesce_key,
+                run_at=run_at, max_attempts=max_attempts
+            )
+
+        function.job_name = job_name
+        function.enqueue = enqueue_job
+        function.delay = lambda *args, **kwargs: enqueue_job(args=args, kwargs=kwargs)
+        return function
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def get_registered_job(name):
+    """Retourne la fonction enregistrée sous ce nom (KeyError sinon)."""
+    return _registry[name]
+
+
+def enqueue(name, args=(), kwargs=None, coalesce_key=None, run_at=None, max_attempts=None):
+    """
+    Ajoute un travail à la file.
+
+    Avec une coalesce_key, un seul travail peut être en attente par clé :
+    si un travail identique attend déjà, il est réutilisé au lieu d'en créer
+    un second (ex: dix logs synchronisés pour un cycle = un seul recalcul).
+
+    Returns:
+        Job: travail créé ou travail en attente existant
+    """
+    fields = {
+        'name': name,
+        'args': list(args),
+        'kwargs': kwargs or {},
+        'coalesce_key': coalesce_key,
+        'run_at': run_at or timezone.now(),
+        'max_attempts': max_attempts or _setting('JOBS_MAX_ATTEMPTS', 5),
+    }
+
+    if coalesce_key is None:
+        return Job.objects.create(**fields)
+
+    for attempt in range(ENQUEUE_ATTEMPTS):
+        existing = Job.objects.filter(coalesce_key=coalesce_key, status=Job.STATUS_PENDING).first()
+        if existing:
+            return existing
+
+        try:
+            with transaction.atomic():
+                return Job.objects.create(**fields)
+        except IntegrityError:
+            # Un autre processus vient de créer le même travail ; s'il a déjà
+            # été réservé entre-temps, on recommence la création
+            if attempt == ENQUEUE_ATTEMPTS - 1:
+                raise
+
+
+def _claimable_jobs(now):
+    """Travaux échus dont la clé de regroupement n'est pas déjà en cours."""
+    running_same_key = Job.objects.filter(
+        status=Job.STATUS_RUNNING,
+        coalesce_key=OuterRef('coalesce_key'),
+    )
+    return Job.objects.filter(
+        status=Job.STATUS_PENDING,
+        run_at__lte=now,
+    ).exclude(Exists(running_same_key)).order_by('run_at', 'id')
+
+
+def claim_jobs(worker_id, limit=10):
+    """
+    Réserve jusqu'à `limit` travaux échus pour un worker.
+
+    PostgreSQL : SELECT ... FOR UPDATE SKIP LOCKED, les workers concurrents
+    ne se bloquent jamais sur les mêmes lignes.
+    SQLite (pas de SKIP LOCKED) : chaque ligne est réservée par un UPDATE
+    conditionnel sur le statut ; une ligne déjà prise par un autre worker
+    est simplement ignorée.
+
+    Toutes les lectures se font sur la base principale : un réplica en
+    retard proposerait des travaux déjà réservés ou terminés.
+
+    Returns:
+        list: travaux réservés (statut running)
+    """
+    now = timezone.now()
+    claim_fields = {
+        'status': Job.STATUS_RUNNING,
+        'locked_by': worker_id,
+        'locked_at': now,
+    }
+
+    with primary_reads():
+        if connection.features.has_select_for_update_skip_locked:
+            with transaction.atomic():
+                ids = list(
+                    _claimable_jobs(now)
+                    .select_for_update(skip_locked=True)
+                    .values_list('id', flat=True)[:limit]
+                )
+                Job.objects.filter(id__in=ids).update(**claim_fields)
+        else:
+            ids = []
+            for job_id in _claimable_jobs(now).values_list('id', flat=True)[:limit]:
+                if Job.objects.filter(id=job_id, status=Job.STATUS_PENDING).update(**claim_fields):
+                    ids.append(job_id)
+
+        return list(Job.objects.filter(id__in=ids).order_by('run_at', 'id'))
+
+
+def retry_delay(attempts):
+    """Délai avant nouvelle tentative : base × 2^(tentatives - 1), plafonné."""
+    base = _setting('JOBS_RETRY_BASE_DELAY', 30)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), _setting('JOBS_RETRY_MAX_DELAY', 3600)))
+
+
+def _save_result(job, **fields):
+    """
+    Enregistre le résultat d'un travail s'il est toujours réservé par ce
+    worker : un travail repris par requeue_stale_jobs() appartient à un autre.
+
+    Returns:
+        bool: True si la ligne a été mise à jour
+    """
+    updated = Job.objects.filter(
+        pk=job.pk, status=Job.STATUS_RUNNING, locked_by=job.locked_by
+    ).update(**fields)
+    if not updated:
+        logger.warning("Travail %s (%s) repris par un autre worker, résultat ignoré", job.id, job.name)
+    return bool(updated)
+
+
+def run_job(job):
+    """
+    Exécute un travail réservé et enregistre son résultat.
+
+    En cas d'erreur, le travail repasse en attente après un délai
+    exponentiel, jusqu'à max_attempts tentatives.
+
+    Returns:
+        bool: True si le travail a réussi
+    """
+    job.attempts += 1
+    try:
+        get_registered_job(job.name)(*job.args, **job.kwargs)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = Job.STATUS_PENDING
+            job.run_at = timezone.now() + retry_delay(job.attempts)
+            logger.warning("Travail %s (%s) en échec, nouvelle tentative %s", job.id, job.name, job.run_at)
+        else:
+            job.status = Job.STATUS_FAILED
+            job.finished_at = timezone.now()
+            logger.error("Travail %s (%s) abandonné après %s tentatives", job.id, job.name, job.attempts)
+        try:
+            with transaction.atomic():
+                _save_result(
+                    job, attempts=job.attempts, last_error=job.last_error, status=job.status,
+                    run_at=job.run_at, finished_at=job.finished_at,
+                )
+        except IntegrityError:
+            # Un travail plus récent avec la même clé attend déjà : il le remplace
+            job.status = Job.STATUS_FAILED
+            job.finished_at = timezone.now()
+            _save_result(
+                job, attempts=job.attempts, last_error=job.last_error, status=job.status,
+                finished_at=job.finished_at,
+            )
+        return False
+
+    job.status = Job.STATUS_DONE
+    job.finished_at = timezone.now()
+    _save_result(job, attempts=job.attempts, status=job.status, finished_at=job.finished_at)
+    return True
+
+
+def heartbeat(worker_id):
+    """
+    Prolonge la réservation des travaux en cours d'un worker.
+
+    Appelé périodiquement par run_jobs (JOBS_HEARTBEAT_INTERVAL) : un
+    travail plus long que JOBS_STALE_TIMEOUT n'est pas repris par un autre
+    worker tant que le sien est vivant.
+
+    Returns:
+        int: nombre de travaux prolongés
+    """
+    return Job.objects.filter(status=Job.STATUS_RUNNING, locked_by=worker_id).update(
+        locked_at=timezone.now()
+    )
+
+
+def requeue_stale_jobs(timeout=None):
+    """
+    Remet en attente les travaux réservés par un worker arrêté brutalement.
+
+    L'exécution interrompue compte comme une tentative : un travail qui
+    fait tomber son worker (mémoire épuisée...) est abandonné après
+    max_attempts tentatives au lieu d'être repris indéfiniment.
+    Un travail abandonné dont la clé a déjà un travail en attente est
+    marqué échoué : le travail en attente fera le même calcul.
+
+    Returns:
+        int: nombre de travaux remis en attente
+    """
+    timeout = timeout or _setting('JOBS_STALE_TIMEOUT', 600)
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status=Job.STATUS_RUNNING,
+        locked_at__lt=now - timedelta(seconds=timeout),
+    )
+    pending_same_key = Job.objects.filter(
+        status=Job.STATUS_PENDING,
+        coalesce_key=OuterRef('coalesce_key'),
+    )
+    stale.filter(Exists(pending_same_key)).update(
+        status=Job.STATUS_FAILED,
+        attempts=F('attempts') + 1,
+        finished_at=now,
+        last_error='Worker interrompu, remplacé par un travail en attente.',
+    )
+    stale.filter(attempts__gte=F('max_attempts') - 1).update(
+        status=Job.STATUS_FAILED,
+        attempts=F('attempts') + 1,
+        finished_at=now,
+        last_error='Worker interrompu, tentatives épuisées.',
+    )
+    return stale.update(
+        status=Job.STATUS_PENDING, attempts=F('attempts') + 1, locked_by='', locked_at=None
+    )
+
+
+def schedule_periodic_jobs():
+    """
+    Ajoute à la file les travaux périodiques échus.
+
+    Chaque planification utilise sa propre clé de regroupement : un worker
+    en retard n'empile jamais plusieurs exécutions du même travail.
+
+    Returns:
+        int: nombre de planifications déclenchées
+    """
+    now = timezone.now()
+    triggered = 0
+    for schedule in PeriodicSchedule.objects.filter(is_active=True, next_run_at__lte=now):
+        enqueue(schedule.job_name, kwargs=schedule.kwargs, coalesce_key=f'periodic:{schedule.name}')
+
+        next_run_at = schedule.next_run_at + timedelta(seconds=schedule.interval_seconds)
+        if next_run_at <= now:
+            next_run_at = now + timedelta(seconds=schedule.interval_seconds)
+        PeriodicSchedule.objects.filter(pk=schedule.pk).update(next_run_at=next_run_at)
+        triggered += 1
+    return triggered
+
+
+def queue_stats():
+    """
+    Nombre de travaux par statut, en une requête.
+
+    Returns:
+        dict: {statut: nombre}
+    """
+    counts = {status: 0 for status, _label in Job.STATUS_CHOICES}
+    for row in Job.objects.values('status').annotate(total=Count('id')).order_by():
+        counts[row['status']] = row['total']
+    return counts
@@ -0,0 +1,15 @@
+from django.contrib import admin
+
+from .models import UploadSession
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    """
+    Suivi des envois reprenables (diagnostic des envois bloqués)
+    """
+    list_display = ('id', 'user', 'kind', 'received_bytes', 'total_size', 'status', 'created_at', 'expires_at')
+    list_filter = ('kind', 'status')
+    search_fields = ('user__phone_number', 'checksum', 'result')
+    readonly_fields = ('id', 'created_at', 'completed_at')
+    raw_id_fields = ('user',)
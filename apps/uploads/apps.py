@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class UploadsConfig(AppConfig):
+    """
+    Configuration de l'application uploads pour MAVECAM AquaCare.
+
+    Responsabilités :
+    - Envois reprenables par morceaux (photos, lots de synchronisation)
+    - Assemblage et vérification des fichiers côté serveur
+    - Expiration des envois abandonnés
+    """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'uploads'
+    verbose_name = 'Envois de fichiers'
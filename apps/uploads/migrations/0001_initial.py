@@ -0,0 +1,42 @@
+# Generated by Django 5.1.15 on 2026-10-19 05:27
+
+import django.db.models.deletion
+import uploads.models
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('photo', 'Photo du journal sanitaire'), ('sync_batch', 'Lot de synchronisation')], max_length=20, verbose_name='Type de fichier')),
+                ('total_size', models.PositiveBigIntegerField(verbose_name='Taille totale (octets)')),
+                ('checksum', models.CharField(help_text='Empreinte du fichier complet, vérifiée après assemblage', max_length=64, verbose_name='Empreinte SHA-256')),
+                ('chunk_size', models.PositiveIntegerField(verbose_name='Taille des morceaux (octets)')),
+                ('received_bytes', models.PositiveBigIntegerField(default=0, verbose_name='Octets reçus')),
+                ('status', models.CharField(choices=[('open', 'En cours'), ('complete', 'Terminé'), ('failed', 'Échoué'), ('expired', 'Expiré')], default='open', max_length=10, verbose_name='Statut')),
+                ('result', models.CharField(blank=True, help_text='Empreinte de la photo ou chemin du lot assemblé', max_length=255, verbose_name='Résultat')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date de création')),
+                ('expires_at', models.DateTimeField(default=uploads.models.default_expires_at, verbose_name='Expire le')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='Terminé le')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL, verbose_name='Utilisateur')),
+            ],
+            options={
+                'verbose_name': 'Envoi reprenable',
+                'verbose_name_plural': 'Envois reprenables',
+                'db_table': 'uploads_upload_session',
+                'indexes': [models.Index(fields=['status', 'expires_at'], name='uploads_status_expires_idx')],
+            },
+        ),
+    ]
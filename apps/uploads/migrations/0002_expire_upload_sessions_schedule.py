@@ -0,0 +1,34 @@
+from django.db import migrations
+from django.utils import timezone
+
+SCHEDULE_NAME = 'uploads.expire_upload_sessions'
+
+
+def create_schedule(apps, schema_editor):
+    PeriodicSchedule = apps.get_model('jobs', 'PeriodicSchedule')
+    PeriodicSchedule.objects.get_or_create(
+        name=SCHEDULE_NAME,
+        defaults={
+            'job_name': 'uploads.expire_upload_sessions',
+            'kwargs': {},
+            'interval_seconds': 3600,
+            'next_run_at': timezone.now(),
+        },
+    )
+
+
+def delete_schedule(apps, schema_editor):
+    PeriodicSchedule = apps.get_model('jobs', 'PeriodicSchedule')
+    PeriodicSchedule.objects.filter(name=SCHEDULE_NAME).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+        ('uploads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_schedule, delete_schedule),
+    ]
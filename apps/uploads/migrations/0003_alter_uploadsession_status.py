@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0002_expire_upload_sessions_schedule'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadsession',
+            name='status',
+            field=models.CharField(choices=[('open', 'En cours'), ('assembling', 'Assemblage'), ('complete', 'Terminé'), ('failed', 'Échoué'), ('expired', 'Expiré')], default='open', max_length=10, verbose_name='Statut'),
+        ),
+    ]
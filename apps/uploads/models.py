@@ -0,0 +1,130 @@
+import os
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+def default_expires_at():
+    return timezone.now() + timedelta(seconds=getattr(settings, 'UPLOAD_SESSION_TTL', 24 * 3600))
+
+
+class UploadSession(models.Model):
+    """
+    Envoi reprenable d'un fichier, morceau par morceau.
+
+    Métier : Sur une connexion 2G instable, un envoi multipart qui échoue à
+    80% repart de zéro. Ici le client envoie des morceaux de taille fixe ;
+    après une coupure il demande l'offset reçu et reprend à partir de là.
+    """
+
+    KIND_CHOICES = [
+        ('photo', _('Photo du journal sanitaire')),
+        ('sync_batch', _('Lot de synchronisation')),
+    ]
+
+    STATUS_OPEN = 'open'
+    STATUS_ASSEMBLING = 'assembling'
+    STATUS_COMPLETE = 'complete'
+    STATUS_FAILED = 'failed'
+    STATUS_EXPIRED = 'expired'
+
+    STATUS_CHOICES = [
+        (STATUS_OPEN, _('En cours')),
+        (STATUS_ASSEMBLING, _('Assemblage')),
+        (STATUS_COMPLETE, _('Terminé')),
+        (STATUS_FAILED, _('Échoué')),
+        (STATUS_EXPIRED, _('Expiré')),
+    ]
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions',
+        verbose_name=_('Utilisateur')
+    )
+
+    kind = models.CharField(
+        _('Type de fichier'),
+        max_length=20,
+        choices=KIND_CHOICES
+    )
+
+    total_size = models.PositiveBigIntegerField(
+        _('Taille totale (octets)')
+    )
+
+    checksum = models.CharField(
+        _('Empreinte SHA-256'),
+        max_length=64,
+        help_text=_('Empreinte du fichier complet, vérifiée après assemblage')
+    )
+
+    chunk_size = models.PositiveIntegerField(
+        _('Taille des morceaux (octets)')
+    )
+
+    received_bytes = models.PositiveBigIntegerField(
+        _('Octets reçus'),
+        default=0
+    )
+
+    status = models.CharField(
+        _('Statut'),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_OPEN
+    )
+
+    result = models.CharField(
+        _('Résultat'),
+        max_length=255,
+        blank=True,
+        help_text=_('Empreinte de la photo ou chemin du lot assemblé')
+    )
+
+    created_at = models.DateTimeField(
+        _('Date de création'),
+        auto_now_add=True
+    )
+
+    expires_at = models.DateTimeField(
+        _('Expire le'),
+        default=default_expires_at
+    )
+
+    completed_at = models.DateTimeField(
+        _('Terminé le'),
+        null=True,
+        blank=True
+    )
+
+    class Meta:
+        app_label = 'uploads'
+        verbose_name = _('Envoi reprenable')
+        verbose_name_plural = _('Envois reprenables')
+        db_table = 'uploads_upload_session'
+        indexes = [
+            models.Index(fields=['status', 'expires_at'], name='uploads_status_expires_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.received_bytes}/{self.total_size}"
+
+    @property
+    def part_path(self):
+        """Fichier temporaire où les morceaux sont écrits."""
+        return os.path.join(settings.MEDIA_ROOT, 'upload_sessions', f'{self.id}.part')
+
+    @property
+    def is_open(self):
+        return self.status == self.STATUS_OPEN and self.expires_at > timezone.now()
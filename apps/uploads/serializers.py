@@ -0,0 +1,36 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from .models import UploadSession
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Serializer pour l'ouverture et le suivi d'une session d'envoi
+    """
+    checksum = serializers.RegexField(
+        r'^[0-9a-fA-F]{64}$',
+        help_text="Empreinte SHA-256 (hexadécimale) du fichier complet"
+    )
+
+    class Meta:
+        model = UploadSession
+        fields = (
+            'id', 'kind', 'total_size', 'checksum', 'chunk_size',
+            'received_bytes', 'status', 'result', 'expires_at'
+        )
+        read_only_fields = (
+            'id', 'chunk_size', 'received_bytes', 'status', 'result', 'expires_at'
+        )
+
+    def validate_total_size(self, value):
+        if not 0 < value <= settings.UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"La taille doit être comprise entre 1 et {settings.UPLOAD_MAX_SIZE} octets."
+            )
+        return value
+
+    def create(self, validated_data):
+        validated_data['checksum'] = validated_data['checksum'].lower()
+        validated_data['chunk_size'] = settings.UPLOAD_CHUNK_SIZE
+        return super().create(validated_data)
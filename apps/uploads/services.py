@@ -0,0 +1,230 @@
+"""
+Protocole d'envoi reprenable.
+
+Métier : Une photo de 300 Ko envoyée en multipart sur une connexion 2G
+échoue souvent avant la fin et repart de zéro. Le client ouvre plutôt une
+session d'envoi, puis envoie des morceaux de taille fixe avec leur offset
+et leur empreinte SHA-256 :
+- un morceau déjà reçu (nouvelle tentative après coupure) est ignoré
+- un morceau hors séquence est refusé avec l'offset attendu, le client
+  reprend à partir de là sans renvoyer ce qui est déjà arrivé
+- le fichier assemblé est vérifié avec l'empreinte annoncée à l'ouverture
+
+Les octets transférés par envoi réussi restent proches de la taille du
+fichier, même avec de nombreuses coupures.
+"""
+import hashlib
+import os
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image
+
+from aquaculture.photos import store_photo
+from jobs.queue import register_job
+
+from .models import UploadSession
+
+SYNC_BATCH_ROOT = 'sync_batches'
+
+
+class UploadError(Exception):
+    """Erreur du protocole d'envoi, traduite en réponse HTTP par les vues."""
+
+
+class UploadClosed(UploadError):
+    """La session est terminée, échouée ou expirée."""
+
+
+class OffsetMismatch(UploadError):
+    """Le morceau ne commence pas à l'offset attendu par le serveur."""
+
+
+class InvalidChunk(UploadError):
+    """Taille ou empreinte du morceau incorrecte."""
+
+
+class ChecksumMismatch(UploadError):
+    """Le fichier assemblé ne correspond pas à l'empreinte annoncée."""
+
+
+class UnreadableFile(UploadError):
+    """Le fichier assemblé n'a pas pu être enregistré (image illisible...)."""
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as part:
+        for chunk in iter(lambda: part.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _remove_part(session):
+    try:
+        os.remove(session.part_path)
+    except FileNotFoundError:
+        pass
+
+
+def _finish_assembly(session, **fields):
+    """Termine l'assemblage réservé par complete_upload (mise à jour conditionnelle)."""
+    UploadSession.objects.filter(
+        pk=session.pk, status=UploadSession.STATUS_ASSEMBLING
+    ).update(**fields)
+    session.refresh_from_db()
+
+
+def _fail_session(session):
+    _remove_part(session)
+    _finish_assembly(session, status=UploadSession.STATUS_FAILED)
+
+
+def write_chunk(session, offset, data, checksum):
+    """
+    Écrit un morceau dans la session, puis assemble le fichier s'il est complet.
+
+    Args:
+        session (UploadSession): session ouverte
+        offset (int): position du morceau dans le fichier
+        data (bytes): contenu du morceau
+        checksum (str): empreinte SHA-256 du morceau
+
+    Returns:
+        UploadSession: session mise à jour
+
+    Raises:
+        UploadClosed, OffsetMismatch, InvalidChunk, ChecksumMismatch,
+        UnreadableFile
+    """
+    # Nouvel envoi du dernier morceau pendant ou après l'assemblage
+    # (réponse lente ou perdue sur le réseau) : rien à refaire
+    if (
+        session.status in (UploadSession.STATUS_ASSEMBLING, UploadSession.STATUS_COMPLETE)
+        and offset + len(data) <= session.received_bytes
+    ):
+        return session
+
+    if not session.is_open:
+        raise UploadClosed(session.status)
+
+    # Tous les octets sont arrivés mais l'assemblage n'a pas abouti
+    # (réponse perdue, processus interrompu) : on le termine
+    if session.received_bytes == session.total_size:
+        return complete_upload(session)
+
+    # Morceau déjà reçu : la réponse précédente s'est perdue sur le réseau
+    if offset + len(data) <= session.received_bytes:
+        return session
+
+    if offset != session.received_bytes:
+        raise OffsetMismatch(session.received_bytes)
+
+    expected_size = min(session.chunk_size, session.total_size - offset)
+    if len(data) != expected_size:
+        raise InvalidChunk(f"Taille attendue : {expected_size} octets")
+    if hashlib.sha256(data).hexdigest() != checksum.lower():
+        raise InvalidChunk("Empreinte du morceau incorrecte")
+
+    os.makedirs(os.path.dirname(session.part_path), exist_ok=True)
+    with open(session.part_path, 'r+b' if offset else 'wb') as part:
+        part.seek(offset)
+        part.write(data)
+
+    # Mise à jour conditionnelle : deux envois concurrents du même morceau
+    # ne font avancer l'offset qu'une fois
+    updated = UploadSession.objects.filter(
+        pk=session.pk, status=UploadSession.STATUS_OPEN, received_bytes=offset
+    ).update(received_bytes=offset + len(data))
+    session.refresh_from_db()
+    if not updated:
+        raise OffsetMismatch(session.received_bytes)
+
+    if session.received_bytes == session.total_size:
+        complete_upload(session)
+    return session
+
+
+def complete_upload(session):
+    """
+    Vérifie le fichier assemblé et le rattache à sa destination.
+
+    - photo : enregistrée par store_photo, le résultat est l'empreinte à
+      renseigner sur le SanitaryLog
+    - sync_batch : conservée dans le stockage, le résultat est son chemin
+
+    L'assemblage est d'abord réservé (passage conditionnel de 'open' à
+    'assembling') : un client qui renvoie le dernier morceau pendant le
+    traitement de la photo ne lance pas un second assemblage concurrent,
+    il reçoit l'état en cours.
+
+    Dans les deux cas d'erreur, le fichier est supprimé et la session
+    échoue : le client doit ouvrir une nouvelle session.
+
+    Raises:
+        UploadClosed: la session a été fermée par une autre requête
+        ChecksumMismatch: le fichier ne correspond pas à l'empreinte annoncée
+        UnreadableFile: image illisible ou erreur du stockage
+    """
+    claimed = UploadSession.objects.filter(
+        pk=session.pk, status=UploadSession.STATUS_OPEN, received_bytes=session.total_size
+    ).update(status=UploadSession.STATUS_ASSEMBLING)
+    session.refresh_from_db()
+    if not claimed:
+        # Assemblage en cours ou terminé par une requête concurrente
+        if session.status in (UploadSession.STATUS_ASSEMBLING, UploadSession.STATUS_COMPLETE):
+            return session
+        raise UploadClosed(session.status)
+
+    try:
+        digest = _file_digest(session.part_path)
+    except FileNotFoundError:
+        _fail_session(session)
+        raise UnreadableFile("Fichier assemblé introuvable")
+
+    if digest != session.checksum.lower():
+        _fail_session(session)
+        raise ChecksumMismatch(session.checksum)
+
+    try:
+        with open(session.part_path, 'rb') as part:
+            if session.kind == 'photo':
+                result = store_photo(part)
+            else:
+                result = default_storage.save(
+                    f"{SYNC_BATCH_ROOT}/{session.user_id}/{session.id}.json", File(part)
+                )
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        # UnidentifiedImageError est une OSError
+        _fail_session(session)
+        raise UnreadableFile(str(exc))
+
+    _remove_part(session)
+    _finish_assembly(
+        session, result=result, status=UploadSession.STATUS_COMPLETE, completed_at=timezone.now()
+    )
+    return session
+
+
+@register_job(name='uploads.expire_upload_sessions')
+def expire_upload_sessions():
+    """
+    Supprime les fichiers des sessions abandonnées et les marque expirées,
+    y compris un assemblage interrompu par l'arrêt du processus.
+
+    Planifié toutes les heures (PeriodicSchedule créé par la migration
+    uploads 0002).
+
+    Returns:
+        int: nombre de sessions expirées
+    """
+    unfinished = (UploadSession.STATUS_OPEN, UploadSession.STATUS_ASSEMBLING)
+    expired = UploadSession.objects.filter(status__in=unfinished, expires_at__lte=timezone.now())
+    count = 0
+    for session in expired.iterator():
+        _remove_part(session)
+        count += UploadSession.objects.filter(
+            pk=session.pk, status__in=unfinished
+        ).update(status=UploadSession.STATUS_EXPIRED)
+    return count
@@ -0,0 +1,4 @@
+"""
+Travaux asynchrones de l'application uploads (chargés par run_jobs).
+"""
+from .services import expire_upload_sessions  # noqa: F401
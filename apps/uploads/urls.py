@@ -0,0 +1,19 @@
+"""
+Configuration des URLs pour l'application uploads.
+
+Ces URLs seront préfixées par '/api/uploads/' dans le projet principal.
+"""
+
+from django.urls import path, re_path
+from . import views
+
+app_name = 'uploads'
+
+urlpatterns = [
+    path('', views.UploadSessionCreateView.as_view(), name='session_create'),
+    path('<uuid:pk>/', views.UploadSessionView.as_view(), name='session_detail'),
+    re_path(
+        r'^photos/(?P<digest>[0-9a-f]{64})/(?P<variant>[a-z]+)\.webp$',
+        views.PhotoVariantView.as_view(), name='photo_variant'
+    ),
+]
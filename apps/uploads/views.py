@@ -0,0 +1,146 @@
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils.http import parse_etags
+from django.shortcuts import get_object_or_404
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from aquaculture.photos import IMMUTABLE_CACHE_CONTROL, PHOTO_VARIANTS, photo_path
+
+from .models import UploadSession
+from .serializers import UploadSessionSerializer
+from .services import (
+    ChecksumMismatch, InvalidChunk, OffsetMismatch, UnreadableFile, UploadClosed, write_chunk,
+)
+
+
+def _session_response(session, status_code=status.HTTP_200_OK):
+    response = Response(UploadSessionSerializer(session).data, status=status_code)
+    response['Upload-Offset'] = str(session.received_bytes)
+    return response
+
+
+class UploadSessionCreateView(generics.CreateAPIView):
+    """
+    📤 Ouverture d'un envoi reprenable (photo ou lot de synchronisation).
+
+    Le client annonce la taille et l'empreinte SHA-256 du fichier, puis
+    envoie des morceaux de `chunk_size` octets sur l'URL de la session.
+    """
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+class UploadSessionView(APIView):
+    """
+    📦 Suivi et envoi des morceaux d'une session.
+
+    **GET** : offset reçu par le serveur (à interroger après une coupure)
+
+    **PUT** : un morceau, corps binaire brut avec les en-têtes :
+    - `Upload-Offset` : position du morceau dans le fichier
+    - `Upload-Checksum` : empreinte SHA-256 du morceau
+
+    **Réponses :**
+    - 200 : morceau accepté (ou déjà reçu), en-tête `Upload-Offset` à jour
+      ; statut `assembling` si le fichier complet est encore en traitement
+      (interroger la session en GET)
+    - 409 : offset inattendu, reprendre à l'offset renvoyé
+    - 400 : morceau corrompu, le renvoyer
+    - 410 : session expirée ou échouée (fichier corrompu ou illisible),
+      en ouvrir une nouvelle
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_object(self, pk):
+        return get_object_or_404(UploadSession, pk=pk, user=self.request.user)
+
+    @extend_schema(
+        summary="État d'un envoi reprenable",
+        responses={200: UploadSessionSerializer},
+    )
+    def get(self, request, pk):
+        return _session_response(self.get_object(pk))
+
+    @extend_schema(
+        summary="Envoi d'un morceau",
+        request={'application/octet-stream': bytes},
+        parameters=[
+            OpenApiParameter('Upload-Offset', int, OpenApiParameter.HEADER, required=True),
+            OpenApiParameter('Upload-Checksum', str, OpenApiParameter.HEADER, required=True),
+        ],
+        responses={
+            200: UploadSessionSerializer,
+            400: OpenApiResponse(description="Morceau invalide"),
+            409: OpenApiResponse(description="Offset inattendu"),
+            410: OpenApiResponse(description="Session fermée"),
+        }
+    )
+    def put(self, request, pk):
+        session = self.get_object(pk)
+
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            checksum = request.headers['Upload-Checksum']
+        except (KeyError, ValueError):
+            return Response(
+                {'error': "En-têtes Upload-Offset et Upload-Checksum requis."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            session = write_chunk(session, offset, request.body, checksum)
+        except OffsetMismatch:
+            session.refresh_from_db()
+            return _session_response(session, status.HTTP_409_CONFLICT)
+        except InvalidChunk as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        except (UploadClosed, ChecksumMismatch, UnreadableFile):
+            session.refresh_from_db()
+            return _session_response(session, status.HTTP_410_GONE)
+
+        return _session_response(session)
+
+
+class PhotoVariantView(APIView):
+    """
+    🖼️ Variante WebP d'une photo du journal sanitaire.
+
+    Le chemin contient l'empreinte du contenu : la réponse ne change jamais
+    et peut être gardée indéfiniment par le téléphone (cache privé, l'accès
+    est authentifié).
+
+    **Réponses :**
+    - 200 : image WebP, `Cache-Control` immuable
+    - 304 : `If-None-Match` correspond à l'ETag, image déjà en cache
+    - 404 : photo inconnue ou variante pas encore générée (utiliser
+      'original' en attendant)
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    @extend_schema(
+        summary="Variante d'une photo",
+        responses={
+            (200, 'image/webp'): OpenApiResponse(description="Image WebP"),
+            404: OpenApiResponse(description="Photo ou variante introuvable"),
+        }
+    )
+    def get(self, request, digest, variant):
+        path = photo_path(digest, variant)
+        if variant not in PHOTO_VARIANTS or not default_storage.exists(path):
+            raise Http404
+
+        etag = f'"{digest}-{variant}"'
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(default_storage.open(path), content_type='image/webp')
+        response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        response['ETag'] = etag
+        return response
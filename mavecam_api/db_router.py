@@ -0,0 +1,130 @@
+"""
+Routage des lectures vers les réplicas PostgreSQL.
+
+Métier : Les tableaux de bord, profils et catalogues sont lus bien plus
+souvent qu'ils ne sont écrits, mais la synchronisation mobile écrit en
+rafales sur la base principale. Les lectures sont donc envoyées aux
+réplicas (alias 'replica_N' de DATABASES, voir DB_REPLICAS) et les
+écritures à 'default'.
+
+Un réplica a quelques secondes de retard : un pisciculteur qui vient
+d'enregistrer son profil doit le relire tel qu'il l'a saisi. Après une
+écriture, les lectures restent sur la base principale :
+- jusqu'à la fin de la requête ou du travail en cours
+- puis pendant DB_REPLICA_STICKY_SECONDS, via un cookie posé sur la réponse
+"""
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY_DB = 'default'
+STICKY_COOKIE_NAME = 'mavecam_primary_until'
+
+_primary_pinned = ContextVar('mavecam_primary_pinned', default=False)
+_has_written = ContextVar('mavecam_has_written', default=False)
+
+
+def get_replicas():
+    """Alias des réplicas configurés (aucun en développement)."""
+    return [alias for alias in settings.DATABASES if alias != PRIMARY_DB]
+
+
+def reset_routing_state():
+    """Remet l'état de routage à zéro (début de requête)."""
+    _primary_pinned.set(False)
+    _has_written.set(False)
+
+
+@contextmanager
+def primary_reads():
+    """Force les lectures sur la base principale (ex: vérification avant écriture)."""
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+@contextmanager
+def untracked_writes():
+    """
+    Écritures techniques faites pendant une requête (ex: tampon d'activité)
+    qui ne concernent pas le client : elles vont à la base principale sans
+    rendre ses lectures suivantes collantes ni poser le cookie.
+    """
+    pinned = _primary_pinned.set(True)
+    written = _has_written.set(_has_written.get())
+    try:
+        yield
+    finally:
+        _has_written.reset(written)
+        _primary_pinned.reset(pinned)
+
+
+class PrimaryReplicaRouter:
+    """
+    Lectures vers un réplica au hasard, écritures et migrations sur 'default'.
+
+    Les lectures verrouillantes (select_for_update) passent par db_for_write
+    et restent donc sur la base principale ; les lectures qui préparent une
+    écriture se placent sous primary_reads() (ex: jobs.queue.claim_jobs).
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replicas()
+        if not replicas or _primary_pinned.get():
+            return PRIMARY_DB
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        # Lire ses propres écritures : la suite du contexte lit la base principale
+        _primary_pinned.set(True)
+        _has_written.set(True)
+        return PRIMARY_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplicas et base principale contiennent les mêmes données
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DB
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Garde les lectures d'un client sur la base principale après ses écritures.
+
+    - requête non sûre (POST, PUT, PATCH, DELETE) : toute la requête lit
+      la base principale
+    - cookie de stickiness encore valide : idem
+    - écriture pendant la requête : le cookie est posé pour
+      DB_REPLICA_STICKY_SECONDS
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        reset_routing_state()
+
+        try:
+            sticky_until = float(request.COOKIES.get(STICKY_COOKIE_NAME, 0))
+        except ValueError:
+            sticky_until = 0
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') or sticky_until > time.time():
+            _primary_pinned.set(True)
+
+        try:
+            response = self.get_response(request)
+            if _has_written.get() and get_replicas():
+                sticky_seconds = settings.DB_REPLICA_STICKY_SECONDS
+                response.set_cookie(
+                    STICKY_COOKIE_NAME, str(int(time.time() + sticky_seconds)),
+                    max_age=sticky_seconds, httponly=True, samesite='Lax'
+                )
+            return response
+        finally:
+            reset_routing_state()
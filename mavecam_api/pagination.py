@@ -0,0 +1,202 @@
+"""
+Pagination par curseur (keyset), par défaut pour toutes les listes de l'API.
+
+Métier : PageNumberPagination exécute un COUNT(*) puis un OFFSET à chaque
+page ; sur les logs de cycle, les commandes, les messages ou l'annuaire des
+pisciculteurs, la centième page lit et jette 5000 lignes. Ici chaque page
+reprend après la dernière ligne vue, sur la clé (created_at, id) :
+- coût constant quelle que soit la profondeur (index sur la clé)
+- ordre stable même si des lignes sont insérées pendant la navigation
+  (la synchronisation mobile écrit en continu)
+- curseurs opaques : le client renvoie les liens next/previous tels quels
+
+Les vues dont le modèle n'a pas de created_at définissent
+`pagination_ordering` (ex: ('-date_joined', '-pk')). Les champs de tri
+doivent être non nuls et le dernier doit être unique.
+"""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from functools import reduce
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _model_field(model, name):
+    """Champ de modèle désigné par un nom de tri ('pk' compris)."""
+    return model._meta.pk if name == 'pk' else model._meta.get_field(name)
+
+
+def _encode_value(value):
+    return value if isinstance(value, (int, float)) else (
+        value.isoformat() if hasattr(value, 'isoformat') else str(value)
+    )
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination par curseur sur un tuple de champs (created_at, id par défaut).
+
+    Paramètres de requête :
+    - cursor : curseur opaque renvoyé dans next/previous
+    - page_size : taille de page (max_page_size au plus)
+    - include_total=1 : ajoute un total approximatif, plafonné à
+      PAGINATION_COUNT_CAP pour garder un coût borné
+    """
+
+    ordering = ('-created_at', '-id')
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    total_query_param = 'include_total'
+    invalid_cursor_message = 'Curseur invalide.'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.REST_FRAMEWORK.get('PAGE_SIZE') or 50
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_ordering(self, view):
+        return tuple(getattr(view, 'pagination_ordering', self.ordering))
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'v': values, 'r': int(reverse)}, separators=(',', ':'))
+        return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request, model):
+        """
+        Lit le curseur de la requête et convertit ses valeurs avec les champs
+        de tri du modèle : un curseur modifié à la main donne une 404, pas
+        une erreur à l'exécution de la requête.
+
+        Returns:
+            tuple: (valeurs ou None, sens inverse)
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            values, reverse = payload['v'], bool(payload['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering_fields):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            values = [
+                _model_field(model, name).to_python(value)
+                for (name, _descending), value in zip(self.ordering_fields, values)
+            ]
+        except (ValidationError, ValueError, TypeError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
+        if None in values:
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def keyset_filter(self, values, reverse):
+        """
+        Condition « après la position » pour un tri sur plusieurs champs :
+        (a > x) OR (a = x AND b > y) OR ...
+        """
+        conditions = []
+        for index, (field, descending) in enumerate(self.ordering_fields):
+            lookup = 'gt' if descending == reverse else 'lt'
+            equal = {name: value for (name, _desc), value in zip(self.ordering_fields[:index], values)}
+            conditions.append(Q(**equal, **{f'{field}__{lookup}': values[index]}))
+        return reduce(lambda left, right: left | right, conditions)
+
+    def position(self, instance):
+        return [_encode_value(getattr(instance, field)) for field, _descending in self.ordering_fields]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering_fields = [
+            (field.lstrip('-'), field.startswith('-')) for field in self.get_ordering(view)
+        ]
+        values, reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = [
+            f'-{field}' if descending != reverse else field
+            for field, descending in self.ordering_fields
+        ]
+        page_queryset = queryset.order_by(*ordering)
+        if values is not None:
+            page_queryset = page_queryset.filter(self.keyset_filter(values, reverse))
+
+        # Une ligne de plus pour savoir s'il existe une page suivante
+        results = list(page_queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        has_following = has_more if not reverse else values is not None
+        has_preceding = values is not None if not reverse else has_more
+        self.next_cursor = self.encode_cursor(self.position(results[-1]), False) if results and has_following else None
+        self.previous_cursor = self.encode_cursor(self.position(results[0]), True) if results and has_preceding else None
+
+        self.total = None
+        if request.query_params.get(self.total_query_param) in ('1', 'true'):
+            cap = settings.PAGINATION_COUNT_CAP
+            count = queryset.order_by()[:cap + 1].count()
+            self.total = {'count': min(count, cap), 'count_is_approximate': count > cap}
+        return results
+
+    def get_link(self, cursor):
+        if cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        return self.get_link(self.next_cursor)
+
+    def get_previous_link(self):
+        return self.get_link(self.previous_cursor)
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        }
+        if self.total is not None:
+            payload.update(self.total)
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'count': {'type': 'integer', 'description': 'Avec include_total=1'},
+                'count_is_approximate': {'type': 'boolean'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param, 'required': False, 'in': 'query',
+                'description': 'Curseur opaque (liens next/previous)', 'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param, 'required': False, 'in': 'query',
+                'description': f'Taille de page (max {self.max_page_size})', 'schema': {'type': 'integer'},
+            },
+            {
+                'name': self.total_query_param, 'required': False, 'in': 'query',
+                'description': 'Ajoute un total approximatif', 'schema': {'type': 'boolean'},
+            },
+        ]
@@ -3,6 +3,8 @@ from datetime import timedelta
 import sys
 import os
 
+from decouple import Csv, config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -39,6 +41,8 @@ INSTALLED_APPS = [
     "drf_spectacular",  # Swagger documentation
     # Local apps
     "accounts",
+    "jobs",  # File de travaux asynchrones (sans broker)
+    "uploads",  # Envois reprenables par morceaux
     # 'aquaculture',  # À ajouter en Phase 2
     # 'commerce',     # À ajouter en Phase 3
     # 'support',      # À ajouter en Phase 4
@@ -48,6 +52,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "mavecam_api.db_router.ReplicaStickinessMiddleware",  # Lire ses écritures
     "django.contrib.sessions.middleware.SessionMiddleware",
     "accounts.middleware.LoginRateLimitMiddleware",  # Rate limiting MAVECAM
     "django.middleware.locale.LocaleMiddleware",  # i18n FR/EN
@@ -84,12 +89,64 @@ WSGI_APPLICATION = "mavecam_api.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
+# Base principale configurée par variables d'environnement (SQLite par défaut)
+DB_ENGINE = config("DB_ENGINE", default="django.db.backends.sqlite3")
+
+PRIMARY_DATABASE = {
+    "ENGINE": DB_ENGINE,
+    "NAME": config("DB_NAME", default=str(BASE_DIR / "db.sqlite3")),
+    "USER": config("DB_USER", default=""),
+    "PASSWORD": config("DB_PASSWORD", default=""),
+    "HOST": config("DB_HOST", default=""),
+    "PORT": config("DB_PORT", default=""),
+    # Connexions persistantes entre requêtes (secondes, 0 = fermées à chaque requête)
+    "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=0, cast=int),
+    "CONN_HEALTH_CHECKS": True,
+}
+
+if config("DB_POOL", default=False, cast=bool):
+    # Pool de connexions natif Django 5.1 (PostgreSQL + psycopg[pool]),
+    # incompatible avec les connexions persistantes
+    PRIMARY_DATABASE["CONN_MAX_AGE"] = 0
+    PRIMARY_DATABASE["OPTIONS"] = {
+        "pool": {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+        },
+    }
+
+DATABASES = {"default": PRIMARY_DATABASE}
+
+# Réplicas en lecture : hôtes PostgreSQL (ou fichiers pour SQLite), séparés par des virgules
+for index, replica in enumerate(config("DB_REPLICAS", default="", cast=Csv()), start=1):
+    DATABASES[f"replica_{index}"] = {
+        **PRIMARY_DATABASE,
+        "NAME" if "sqlite" in DB_ENGINE else "HOST": replica,
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["mavecam_api.db_router.PrimaryReplicaRouter"]
+
+# Durée (secondes) pendant laquelle un client lit la base principale après une écriture
+DB_REPLICA_STICKY_SECONDS = config("DB_REPLICA_STICKY_SECONDS", default=10, cast=int)
+
+# Cache partagé entre les processus (version du guide nutritionnel, graphiques).
+# Par défaut des fichiers communs à tous les workers d'un serveur (développement,
+# déploiement terrain sur une machine). En production sur plusieurs serveurs,
+# un cache réseau est requis : CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# et CACHE_LOCATION=redis://... Les tests utilisent un cache en mémoire (tests/conftest.py).
+CACHE_BACKEND = config("CACHE_BACKEND", default="django.core.cache.backends.filebased.FileBasedCache")
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": config("CACHE_LOCATION", default=str(BASE_DIR / "cache")),
     }
 }
+if "filebased" in CACHE_BACKEND:
+    # Défaut Django : 300 entrées, trop peu pour les graphiques par cycle
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=20000, cast=int),
+    }
 
 
 # Password validation
@@ -113,6 +170,15 @@ AUTH_PASSWORD_VALIDATORS = [
 
 STATIC_URL = "static/"
 
+# Fichiers envoyés (photos du journal sanitaire)
+MEDIA_URL = "media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
+# Envois reprenables (connexions 2G instables)
+UPLOAD_CHUNK_SIZE = 32 * 1024  # octets par morceau
+UPLOAD_MAX_SIZE = 20 * 1024 * 1024  # photo ou lot de synchronisation
+UPLOAD_SESSION_TTL = 24 * 3600  # secondes avant expiration d'un envoi abandonné
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
@@ -121,7 +187,7 @@ AUTH_USER_MODEL = "accounts.User"
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ActivityJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -129,17 +195,21 @@ REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
         "rest_framework.renderers.JSONRenderer",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # Pagination par curseur sur (created_at, id) : coût constant en profondeur
+    "DEFAULT_PAGINATION_CLASS": "mavecam_api.pagination.KeysetPagination",
     "PAGE_SIZE": 50,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# Plafond du total approximatif des listes (?include_total=1)
+PAGINATION_COUNT_CAP = 1000
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),  # 15 minutes comme spécifié
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),  # 7 jours comme spécifié
     "ROTATE_REFRESH_TOKENS": True,  # Sécurité: rotation des tokens
     "BLACKLIST_AFTER_ROTATION": True,
-    "UPDATE_LAST_LOGIN": True,
+    "UPDATE_LAST_LOGIN": False,  # last_login écrit par lots (accounts.activity)
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "VERIFYING_KEY": None,
@@ -149,6 +219,21 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Écriture groupée de last_login / last_activity
+ACTIVITY_FLUSH_INTERVAL = 5  # secondes
+ACTIVITY_FLUSH_BATCH_SIZE = 500  # utilisateurs par UPDATE ... CASE
+
+# File de travaux asynchrones (remplace Celery, pas de broker en déploiement terrain)
+# Travaux exécutés en parallèle par `manage.py run_jobs` (SQLite : un seul écrivain)
+JOBS_WORKER_THREADS = config(
+    "JOBS_WORKER_THREADS", default=1 if "sqlite" in DB_ENGINE else 4, cast=int
+)
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_BASE_DELAY = 30  # secondes, doublé à chaque échec
+JOBS_RETRY_MAX_DELAY = 3600
+JOBS_STALE_TIMEOUT = 600  # secondes avant de reprendre le travail d'un worker arrêté
+JOBS_HEARTBEAT_INTERVAL = 60  # secondes entre deux prolongations des travaux en cours
+
 # Internationalisation (FR/EN comme spécifié)
 LANGUAGE_CODE = "fr-fr"  # Français par défaut (public cible Afrique centrale)
 TIME_ZONE = "Africa/Douala"  # Fuseau horaire Cameroun
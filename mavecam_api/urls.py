@@ -4,6 +4,7 @@ Configuration des URLs principales - MAVECAM AquaCare API.
 Structure de l'API:
 - /admin/ : Interface d'administration Django pour équipe MAVECAM
 - /api/accounts/ : Authentification et profils utilisateurs
+- /api/uploads/ : Envois reprenables (photos, lots de synchronisation)
 - /api/aquaculture/ : Cycles de production et logs (Phase 2)
 - /api/commerce/ : Catalogue et commandes (Phase 3)
 - /api/support/ : Assistance technique (Phase 4)
@@ -26,6 +27,7 @@ def api_root(request):
         },
         'endpoints': {
             'accounts': '/api/accounts/',
+            'uploads': '/api/uploads/',
             'admin': '/admin/',
         },
     })
@@ -41,6 +43,7 @@ urlpatterns = [
     
     # API Endpoints
     path('api/accounts/', include('accounts.urls')),
+    path('api/uploads/', include('uploads.urls')),
     
     # Modules à venir :
     # path('api/aquaculture/', include('aquaculture.urls')),    # Phase 2
@@ -4,6 +4,8 @@ Configuration globale pour les tests MAVECAM.
 Ce fichier contient des fixtures réutilisables et la configuration
 partagée entre tous les tests du projet.
 """
+import os
+
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
@@ -12,6 +14,37 @@ from rest_framework_simplejwt.tokens import RefreshToken
 User = get_user_model()
 
 
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'mavecam-tests',
+    }
+}
+
+
+def pytest_configure(config):
+    """
+    Cache en mémoire pour les tests, configuré avant la collecte : les tests
+    qui vident le cache ne touchent pas le cache partagé du poste.
+    """
+    from django.conf import settings
+
+    settings.CACHES = TEST_CACHES
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Les tests marqués slow (benchmarks) ne tournent que sur demande :
+    `pytest -m slow` ou RUN_SLOW_TESTS=1.
+    """
+    if 'slow' in (config.getoption('markexpr') or '') or os.environ.get('RUN_SLOW_TESTS'):
+        return
+    skip_slow = pytest.mark.skip(reason="Test lent : pytest -m slow ou RUN_SLOW_TESTS=1")
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def api_client():
     """
@@ -78,4 +111,16 @@ def mavecam_admin(user_factory):
         last_name='MAVECAM',
         is_staff=True,
         is_superuser=True
-    )
\ No newline at end of file
+    )
+
+@pytest.fixture(autouse=True)
+def clear_activity_buffer():
+    """
+    Vide le tampon d'activité entre les tests : les horodatages en attente
+    ne doivent pas être écrits dans la base d'un autre test.
+    """
+    from accounts.activity import activity_buffer
+
+    activity_buffer.clear()
+    yield
+    activity_buffer.clear()
@@ -4,9 +4,12 @@ Factories pour générer des données de test cohérentes.
 Factory Boy permet de créer facilement des objets de test
 avec des données réalistes pour simuler les vrais utilisateurs MAVECAM.
 """
+from io import BytesIO
+
 import factory
 from django.contrib.auth import get_user_model
 from factory.django import DjangoModelFactory
+from PIL import Image
 
 User = get_user_model()
 
@@ -69,10 +72,27 @@ class CompanyUserFactory(UserFactory):
     age_group = None  # Les entreprises n'ont pas d'âge
 
 
+def make_photo(size=(1920, 1080)):
+    """
+    Photo JPEG de téléphone avec métadonnées EXIF (orientation, modèle).
+
+    Simule les photos du journal sanitaire prises depuis l'app mobile.
+    """
+    image = Image.new('RGB', size, color=(30, 120, 200))
+    exif = Image.Exif()
+    exif[0x0110] = 'Tecno Spark'
+    exif[0x0112] = 6
+    output = BytesIO()
+    image.save(output, format='JPEG', exif=exif)
+    output.seek(0)
+    return output
+
+
 # Exemples d'usage dans les tests :
 # 
 # user = UserFactory()  # Utilisateur individuel avec données aléatoires
 # user = UserFactory(phone_number='+237691234567')  # Avec téléphone spécifique
 # company = CompanyUserFactory()  # Utilisateur entreprise
 # users = UserFactory.create_batch(5)  # 5 utilisateurs d'un coup
-# admin = MavecamAdminFactory()  # Administrateur MAVECAM
\ No newline at end of file
+# admin = MavecamAdminFactory()  # Administrateur MAVECAM
+# photo = make_photo()  # Photo JPEG avec EXIF pour les envois
\ No newline at end of file
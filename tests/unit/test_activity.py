@@ -0,0 +1,137 @@
+"""
+Tests unitaires pour la connexion sans session et l'écriture groupée
+de last_login / last_activity.
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.db import OperationalError, connection
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.activity import ActivityBuffer, activity_buffer
+from mavecam_api import db_router
+from mavecam_api.db_router import STICKY_COOKIE_NAME, ReplicaStickinessMiddleware
+
+
+@pytest.mark.django_db
+class TestActivityBuffer:
+    """
+    Tests du tampon d'horodatages.
+    """
+
+    def setup_method(self):
+        self.buffer = ActivityBuffer()
+
+    @pytest.fixture(autouse=True)
+    def no_inline_flush(self, settings):
+        settings.ACTIVITY_FLUSH_INTERVAL = 3600
+
+    def test_keeps_latest_timestamp_per_user(self, authenticated_user):
+        now = timezone.now()
+        self.buffer.record(authenticated_user.pk, 'last_activity', when=now)
+        self.buffer.record(authenticated_user.pk, 'last_activity', when=now - timedelta(minutes=5))
+        assert len(self.buffer) == 1
+
+        self.buffer.flush()
+        authenticated_user.refresh_from_db()
+        assert authenticated_user.last_activity == now
+        assert len(self.buffer) == 0
+
+    def test_flush_single_update_per_batch(self, user_factory, settings):
+        settings.ACTIVITY_FLUSH_BATCH_SIZE = 2
+        users = [
+            user_factory(phone_number=f'+23769000000{index}', email=f'u{index}@mavecam.com')
+            for index in range(3)
+        ]
+        login_at = timezone.now()
+        self.buffer.record(users[0].pk, 'last_login', 'last_activity', when=login_at)
+        for user in users[1:]:
+            self.buffer.record(user.pk, 'last_activity')
+
+        with CaptureQueriesContext(connection) as queries:
+            assert self.buffer.flush() == 3
+        assert len(queries) == 2
+        assert 'CASE' in queries[0]['sql']
+
+        users[0].refresh_from_db()
+        users[1].refresh_from_db()
+        assert users[0].last_login == login_at
+        assert users[1].last_login is None and users[1].last_activity is not None
+
+    def test_flush_when_interval_elapsed(self, authenticated_user, settings):
+        settings.ACTIVITY_FLUSH_INTERVAL = 0
+        self.buffer.record_activity(authenticated_user.pk)
+        assert len(self.buffer) == 0
+        authenticated_user.refresh_from_db()
+        assert authenticated_user.last_activity is not None
+
+    def test_locked_database_does_not_fail_request(self, authenticated_user, settings, monkeypatch):
+        def locked(*args, **kwargs):
+            raise OperationalError('database is locked')
+
+        monkeypatch.setattr(QuerySet, 'update', locked)
+        settings.ACTIVITY_FLUSH_INTERVAL = 0
+        when = timezone.now()
+        self.buffer.record(authenticated_user.pk, 'last_activity', when=when)
+
+        # Horodatage conservé pour la prochaine écriture
+        assert len(self.buffer) == 1
+        monkeypatch.undo()
+        self.buffer.flush()
+        authenticated_user.refresh_from_db()
+        assert authenticated_user.last_activity == when
+
+    def test_inline_flush_does_not_make_client_sticky(self, authenticated_user, settings, monkeypatch):
+        monkeypatch.setattr(db_router, 'get_replicas', lambda: ['replica_1'])
+        settings.ACTIVITY_FLUSH_INTERVAL = 0
+        routed = []
+
+        def get_response(request):
+            self.buffer.record_activity(authenticated_user.pk)
+            routed.append(db_router.PrimaryReplicaRouter().db_for_read(None))
+            return HttpResponse()
+
+        response = ReplicaStickinessMiddleware(get_response)(RequestFactory().get('/api/accounts/profile/'))
+        assert len(self.buffer) == 0
+        assert routed == ['replica_1']
+        assert STICKY_COOKIE_NAME not in response.cookies
+
+    def test_empty_flush_no_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            assert self.buffer.flush() == 0
+        assert len(queries) == 0
+
+
+@pytest.mark.django_db
+class TestSessionFreeLogin:
+    """
+    Tests de la connexion JWT sans session Django.
+    """
+
+    @pytest.fixture(autouse=True)
+    def no_inline_flush(self, settings):
+        settings.ACTIVITY_FLUSH_INTERVAL = 3600
+
+    def test_login_creates_no_session(self, api_client, authenticated_user):
+        response = api_client.post('/api/accounts/login/', {
+            'phone_number': authenticated_user.phone_number, 'password': 'password123',
+        }, format='json')
+
+        assert response.status_code == 200
+        assert 'sessionid' not in response.cookies
+        assert Session.objects.count() == 0
+
+        authenticated_user.refresh_from_db()
+        assert authenticated_user.last_login is None  # pas encore écrit
+        activity_buffer.flush()
+        authenticated_user.refresh_from_db()
+        assert authenticated_user.last_login is not None
+
+    def test_authenticated_request_records_activity(self, auth_client, authenticated_user):
+        auth_client.get('/api/accounts/profile/')
+        assert len(activity_buffer) == 1
@@ -0,0 +1,147 @@
+"""
+Tests unitaires pour le moteur d'alertes sanitaires incrémental.
+"""
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from aquaculture.alerts import (
+    SEVERITY_CRITICAL,
+    AlertEngine,
+    RateOfChangeRule,
+    ThresholdRule,
+    default_rules,
+    readings_from_log,
+)
+
+START = timezone.make_aware(datetime(2024, 3, 1, 8, 0))
+
+
+def at(minutes):
+    return START + timedelta(minutes=minutes)
+
+
+class TestDefaultRules:
+    """
+    Tests des règles construites depuis OPTIMAL_PARAMETERS.
+    """
+
+    def test_tilapia_has_water_quality_rules(self):
+        metrics = {rule.metric for rule in default_rules('tilapia')}
+        assert {'temperature', 'oxygen', 'ph', 'mortality_rate'} <= metrics
+        assert 'density_kg_m3' not in metrics
+
+    def test_unknown_parameters_only_mortality(self):
+        assert [rule.metric for rule in default_rules('carpe')] == ['mortality_rate']
+
+    def test_readings_from_log_maps_fields(self):
+        readings = readings_from_log({'water_temperature': '28.5', 'dissolved_oxygen': None, 'ph_level': 7})
+        assert readings == {'temperature': 28.5, 'ph': 7.0}
+
+    def test_readings_from_log_mortality_rate(self):
+        log = {'water_temperature': 28, 'mortality_count': 30}
+        assert readings_from_log(log, fish_count=1000) == {'temperature': 28.0, 'mortality_rate': 3.0}
+        # Effectif inconnu : pas de taux
+        assert 'mortality_rate' not in readings_from_log(log)
+        assert 'mortality_rate' not in readings_from_log(log, fish_count=0)
+
+    def test_abnormal_mortality_from_log(self):
+        log = {'mortality_count': 25, 'water_temperature': 28}
+        alerts = AlertEngine().process('c1', 'carpe', START, readings_from_log(log, fish_count=1000))
+        assert [(alert['metric'], alert['rule']) for alert in alerts] == [('mortality_rate', 'threshold')]
+
+
+class TestAlertEngine:
+    """
+    Tests de l'évaluation incrémentale.
+    """
+
+    def setup_method(self):
+        self.emitted = []
+        self.engine = AlertEngine(emit=self.emitted.extend)
+
+    def test_normal_reading_no_alert(self):
+        assert self.engine.process('c1', 'tilapia', at(0), {'temperature': 28, 'oxygen': 6, 'ph': 7.5}) == []
+
+    def test_threshold_alert_emitted_once_per_episode(self):
+        first = self.engine.process('c1', 'tilapia', at(0), {'oxygen': 3})
+        assert [alert['rule'] for alert in first] == ['threshold']
+        assert self.engine.process('c1', 'tilapia', at(30), {'oxygen': 3.2}) == []
+
+        # Retour à la normale puis nouveau dépassement : nouvelle alerte
+        self.engine.process('c1', 'tilapia', at(150), {'oxygen': 5.5})
+        again = self.engine.process('c1', 'tilapia', at(240), {'oxygen': 4.5})
+        assert [alert['rule'] for alert in again] == ['threshold']
+        assert self.emitted == first + again
+
+    def test_sustained_breach_becomes_critical(self):
+        self.engine.process('c1', 'tilapia', at(0), {'temperature': 34})
+        assert self.engine.process('c1', 'tilapia', at(60), {'temperature': 34}) == []
+        alerts = self.engine.process('c1', 'tilapia', at(120), {'temperature': 34})
+        assert [alert['severity'] for alert in alerts] == [SEVERITY_CRITICAL]
+
+    def test_rate_of_change_within_window(self):
+        self.engine.process('c1', 'tilapia', at(0), {'ph': 7.0})
+        alerts = self.engine.process('c1', 'tilapia', at(30), {'ph': 8.0})
+        assert [alert['rule'] for alert in alerts] == ['rate_of_change']
+
+    def test_old_readings_leave_window(self):
+        engine = AlertEngine(
+            rules_for_species=lambda species: [RateOfChangeRule('ph', 0.5)],
+            window=timedelta(hours=1),
+        )
+        engine.process('c1', 'tilapia', at(0), {'ph': 6.6})
+        assert engine.process('c1', 'tilapia', at(180), {'ph': 8.4}) == []
+
+    def test_cycles_have_independent_state(self):
+        self.engine.process('c1', 'tilapia', at(0), {'oxygen': 3})
+        alerts = self.engine.process('c2', 'tilapia', at(0), {'oxygen': 3})
+        assert alerts and alerts[0]['cycle_id'] == 'c2'
+
+    def test_abnormal_mortality(self):
+        alerts = self.engine.process('c1', 'carpe', at(0), {'mortality_rate': 3.5})
+        assert alerts[0]['metric'] == 'mortality_rate'
+        assert alerts[0]['dedup_key'] == 'c1:mortality_rate:threshold:2024-03-01'
+
+    def test_lasting_abnormal_mortality_alerted_daily(self):
+        days = [at(day * 24 * 60) for day in range(3)]
+        alerts = []
+        for timestamp in days:
+            alerts += self.engine.process('c1', 'carpe', timestamp, {'mortality_rate': 5})
+            # Deuxième saisie du même jour : pas de nouvelle alerte
+            alerts += self.engine.process('c1', 'carpe', timestamp + timedelta(hours=2), {'mortality_rate': 5})
+        assert [alert['dedup_key'] for alert in alerts] == [
+            f'c1:mortality_rate:threshold:{timestamp.date().isoformat()}' for timestamp in days
+        ]
+
+    def test_water_quality_alerted_once_per_episode_across_days(self):
+        self.engine.process('c1', 'tilapia', at(0), {'oxygen': 3})
+        next_day = self.engine.process('c1', 'tilapia', at(24 * 60), {'oxygen': 3})
+        assert 'threshold' not in [alert['rule'] for alert in next_day]
+
+
+class TestAlertEngineBatch:
+    """
+    Tests de l'évaluation par lot (synchronisation).
+    """
+
+    def test_batch_sorted_by_time_and_emitted_once(self):
+        calls = []
+        engine = AlertEngine(
+            rules_for_species=lambda species: [ThresholdRule('oxygen', minimum=5)],
+            emit=calls.append,
+        )
+        events = [
+            ('c1', 'tilapia', at(60), {'oxygen': 3}),
+            ('c1', 'tilapia', at(0), {'oxygen': 6}),
+            ('c2', 'tilapia', at(0), {'oxygen': 4}),
+        ]
+        alerts = engine.process_batch(events)
+        assert [alert['cycle_id'] for alert in alerts] == ['c1', 'c2']
+        assert len(calls) == 1 and calls[0] == alerts
+
+    def test_forget_releases_cycle_state(self):
+        engine = AlertEngine()
+        engine.process('c1', 'tilapia', at(0), {'oxygen': 3})
+        engine.forget('c1')
+        assert engine.process('c1', 'tilapia', at(10), {'oxygen': 3})
@@ -0,0 +1,230 @@
+"""
+Tests unitaires pour les calculateurs métier du module aquaculture.
+
+Vérifie que la version vectorisée (BatchAquacultureCalculator) donne les
+mêmes résultats que les formules scalaires, gardes comprises.
+"""
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from aquaculture.calculators import AquacultureCalculator, BatchAquacultureCalculator
+
+
+def assert_matches_scalar(batch_values, scalar_values):
+    """Compare les résultats vectorisés aux Decimal scalaires avec la tolérance documentée."""
+    np.testing.assert_allclose(
+        batch_values,
+        [float(value) for value in scalar_values],
+        rtol=BatchAquacultureCalculator.RELATIVE_TOLERANCE,
+        atol=BatchAquacultureCalculator.ABSOLUTE_TOLERANCE,
+    )
+
+
+class TestAquacultureCalculator:
+    """
+    Tests des formules scalaires du cahier des charges.
+    """
+
+    def test_biomass(self):
+        assert AquacultureCalculator.calculate_biomass(1000, Decimal('25.5')) == Decimal('25500.0')
+
+    def test_survival_rate(self):
+        assert AquacultureCalculator.calculate_survival_rate(1000, 900) == Decimal('90')
+        assert AquacultureCalculator.calculate_survival_rate(0, 900) == Decimal('0')
+
+    def test_fcr_zero_when_no_gain(self):
+        assert AquacultureCalculator.calculate_fcr(Decimal('100'), Decimal('0')) == Decimal('0')
+        assert AquacultureCalculator.calculate_fcr(Decimal('150'), Decimal('100')) == Decimal('1.5')
+
+    def test_specific_growth_rate_guards(self):
+        assert AquacultureCalculator.calculate_specific_growth_rate(Decimal('0'), Decimal('50'), 30) == Decimal('0')
+        assert AquacultureCalculator.calculate_specific_growth_rate(Decimal('5'), Decimal('50'), 0) == Decimal('0')
+
+    def test_growth_stage_tilapia(self):
+        assert AquacultureCalculator.get_growth_stage('tilapia', Decimal('5')) == 'alevin'
+        assert AquacultureCalculator.get_growth_stage('tilapia', Decimal('30')) == 'juvenile'
+        assert AquacultureCalculator.get_growth_stage('tilapia', Decimal('100')) == 'croissance'
+        assert AquacultureCalculator.get_growth_stage('tilapia', Decimal('200')) == 'finition'
+
+
+class TestBatchAquacultureCalculator:
+    """
+    Tests d'équivalence entre les calculs vectorisés et scalaires.
+    """
+
+    def setup_method(self):
+        """Jeu de cycles incluant les cas limites (zéros, négatifs)."""
+        self.initial_counts = [1000, 0, 500, 2000, 1500]
+        self.current_counts = [900, 0, 500, 1800, 0]
+        self.initial_weights = ['5.00', '10.00', '0.00', '20.00', '8.50']
+        self.current_weights = ['120.50', '10.00', '30.00', '15.00', '-1.00']
+        self.lengths = ['18.5', '0', '-2', '20.0', '12.3']
+        self.days = [100, 0, 45, 60, -3]
+        self.feeds = ['150000', '0', '500', '1000', '20']
+
+    def test_biomass_matches_scalar(self):
+        scalar = [
+            AquacultureCalculator.calculate_biomass(count, Decimal(weight))
+            for count, weight in zip(self.current_counts, self.current_weights)
+        ]
+        batch = BatchAquacultureCalculator.calculate_biomass(self.current_counts, self.current_weights)
+        assert_matches_scalar(batch, scalar)
+
+    def test_survival_rate_masks_zero_initial_count(self):
+        scalar = [
+            AquacultureCalculator.calculate_survival_rate(initial, current)
+            for initial, current in zip(self.initial_counts, self.current_counts)
+        ]
+        batch = BatchAquacultureCalculator.calculate_survival_rate(self.initial_counts, self.current_counts)
+        assert_matches_scalar(batch, scalar)
+        assert batch[1] == 0
+
+    def test_fcr_masks_non_positive_gain(self):
+        gains = ['100', '0', '-50', '250.5', '1']
+        scalar = [
+            AquacultureCalculator.calculate_fcr(Decimal(feed), Decimal(gain))
+            for feed, gain in zip(self.feeds, gains)
+        ]
+        batch = BatchAquacultureCalculator.calculate_fcr(self.feeds, gains)
+        assert_matches_scalar(batch, scalar)
+        assert batch[1] == 0 and batch[2] == 0
+
+    def test_daily_growth_rate_masks_zero_days(self):
+        scalar = [
+            AquacultureCalculator.calculate_daily_growth_rate(Decimal(initial), Decimal(final), days)
+            for initial, final, days in zip(self.initial_weights, self.current_weights, self.days)
+        ]
+        batch = BatchAquacultureCalculator.calculate_daily_growth_rate(
+            self.initial_weights, self.current_weights, self.days
+        )
+        assert_matches_scalar(batch, scalar)
+
+    def test_specific_growth_rate_masks_invalid_weights(self):
+        scalar = [
+            AquacultureCalculator.calculate_specific_growth_rate(Decimal(initial), Decimal(final), days)
+            for initial, final, days in zip(self.initial_weights, self.current_weights, self.days)
+        ]
+        with np.errstate(all='raise'):
+            batch = BatchAquacultureCalculator.calculate_specific_growth_rate(
+                self.initial_weights, self.current_weights, self.days
+            )
+        assert_matches_scalar(batch, scalar)
+
+    def test_condition_factor_masks_non_positive_length(self):
+        scalar = [
+            AquacultureCalculator.calculate_condition_factor(Decimal(weight), Decimal(length))
+            for weight, length in zip(self.current_weights, self.lengths)
+        ]
+        batch = BatchAquacultureCalculator.calculate_condition_factor(self.current_weights, self.lengths)
+        assert_matches_scalar(batch, scalar)
+
+    def test_calculate_days_from_dates(self):
+        start = [date(2024, 1, 1), date(2024, 3, 1)]
+        end = [date(2024, 4, 10), date(2024, 3, 1)]
+        days = BatchAquacultureCalculator.calculate_days(start, end)
+        assert days.tolist() == [100, 0]
+
+    def test_cycle_metrics_matches_scalar_per_cycle(self):
+        start_dates = [date(2024, 1, 1) for _ in self.days]
+        end_dates = [start + timedelta(days=days) for start, days in zip(start_dates, self.days)]
+
+        metrics = BatchAquacultureCalculator.calculate_cycle_metrics(
+            self.initial_counts, self.current_counts, self.initial_weights,
+            self.current_weights, self.feeds, start_dates, end_dates,
+            lengths_cm=self.lengths,
+        )
+
+        for index in range(len(self.days)):
+            initial_weight = Decimal(self.initial_weights[index])
+            current_weight = Decimal(self.current_weights[index])
+            initial_biomass = AquacultureCalculator.calculate_biomass(self.initial_counts[index], initial_weight)
+            current_biomass = AquacultureCalculator.calculate_biomass(self.current_counts[index], current_weight)
+            expected = {
+                'survival_rate': AquacultureCalculator.calculate_survival_rate(
+                    self.initial_counts[index], self.current_counts[index]
+                ),
+                'fcr': AquacultureCalculator.calculate_fcr(
+                    Decimal(self.feeds[index]), current_biomass - initial_biomass
+                ),
+                'specific_growth_rate': AquacultureCalculator.calculate_specific_growth_rate(
+                    initial_weight, current_weight, self.days[index]
+                ),
+                'condition_factor': AquacultureCalculator.calculate_condition_factor(
+                    current_weight, Decimal(self.lengths[index])
+                ),
+            }
+            for name, value in expected.items():
+                assert_matches_scalar(metrics[name][index:index + 1], [value])
+
+    def test_accepts_cycles_by_days_matrix(self):
+        """Les colonnes 2D (cycles × jours) sont calculées en une seule opération."""
+        weights = np.array([[5.0, 6.0, 7.5], [10.0, 0.0, 12.0]])
+        days = np.arange(3)
+        sgr = BatchAquacultureCalculator.calculate_specific_growth_rate(weights[:, :1], weights, days)
+        assert sgr.shape == (2, 3)
+        assert sgr[0, 0] == 0 and sgr[1, 1] == 0
+        assert sgr[0, 2] == pytest.approx(float(
+            AquacultureCalculator.calculate_specific_growth_rate(Decimal('5'), Decimal('7.5'), 2)
+        ))
+
+
+@pytest.mark.slow
+class TestBatchCalculatorBenchmark:
+    """
+    Benchmark : 10 000 cycles × 120 jours de suivi.
+
+    Mesure de temps réel, hors de la suite unitaire : lancé seulement par
+    `pytest -m slow -s` ou RUN_SLOW_TESTS=1.
+    """
+
+    CYCLES = 10_000
+    DAYS = 120
+
+    def test_vectorized_recompute_10k_cycles_120_days(self):
+        rng = np.random.default_rng(42)
+        initial_counts = rng.integers(500, 5000, size=(self.CYCLES, 1))
+        mortality = rng.integers(0, 5, size=(self.CYCLES, self.DAYS))
+        counts = initial_counts - np.cumsum(mortality, axis=1)
+        initial_weights = rng.uniform(1, 20, size=(self.CYCLES, 1))
+        weights = initial_weights + np.cumsum(rng.uniform(0, 3, size=(self.CYCLES, self.DAYS)), axis=1)
+        feed = np.cumsum(rng.uniform(0, 5000, size=(self.CYCLES, self.DAYS)), axis=1)
+        lengths = rng.uniform(5, 30, size=(self.CYCLES, self.DAYS))
+        days = np.arange(1, self.DAYS + 1)
+
+        started = time.perf_counter()
+        initial_biomass = BatchAquacultureCalculator.calculate_biomass(initial_counts, initial_weights)
+        biomass = BatchAquacultureCalculator.calculate_biomass(counts, weights)
+        BatchAquacultureCalculator.calculate_survival_rate(initial_counts, counts)
+        BatchAquacultureCalculator.calculate_fcr(feed, biomass - initial_biomass)
+        BatchAquacultureCalculator.calculate_daily_growth_rate(initial_weights, weights, days)
+        BatchAquacultureCalculator.calculate_specific_growth_rate(initial_weights, weights, days)
+        BatchAquacultureCalculator.calculate_condition_factor(weights, lengths)
+        vectorized_seconds = time.perf_counter() - started
+
+        # Échantillon scalaire extrapolé à l'ensemble du lot
+        sample = 50
+        started = time.perf_counter()
+        for cycle in range(sample):
+            initial_count = int(initial_counts[cycle, 0])
+            initial_weight = Decimal(float(initial_weights[cycle, 0]))
+            cycle_initial_biomass = AquacultureCalculator.calculate_biomass(initial_count, initial_weight)
+            for day in range(self.DAYS):
+                weight = Decimal(float(weights[cycle, day]))
+                count = int(counts[cycle, day])
+                day_biomass = AquacultureCalculator.calculate_biomass(count, weight)
+                AquacultureCalculator.calculate_survival_rate(initial_count, count)
+                AquacultureCalculator.calculate_fcr(Decimal(float(feed[cycle, day])), day_biomass - cycle_initial_biomass)
+                AquacultureCalculator.calculate_daily_growth_rate(initial_weight, weight, day + 1)
+                AquacultureCalculator.calculate_specific_growth_rate(initial_weight, weight, day + 1)
+                AquacultureCalculator.calculate_condition_factor(weight, Decimal(float(lengths[cycle, day])))
+        scalar_seconds = (time.perf_counter() - started) * self.CYCLES / sample
+
+        print(
+            f"\n{self.CYCLES} cycles × {self.DAYS} jours : "
+            f"vectorisé {vectorized_seconds:.2f}s, scalaire estimé {scalar_seconds:.1f}s"
+        )
+        assert vectorized_seconds * 10 < scalar_seconds
@@ -0,0 +1,103 @@
+"""
+Tests unitaires pour la réduction des séries de graphiques (LTTB).
+"""
+from datetime import date, timedelta
+
+from django.core.cache import cache
+
+from aquaculture.downsampling import (
+    DEFAULT_CHART_POINTS,
+    MAX_CHART_POINTS,
+    clamp_chart_points,
+    downsample_series,
+    get_cached_downsampled_series,
+    largest_triangle_three_buckets,
+)
+
+
+def growth_series(days):
+    start = date(2024, 1, 1)
+    return [
+        {'date': (start + timedelta(days=day)).isoformat(), 'weight': 5 + day * 0.8, 'day': day}
+        for day in range(days)
+    ]
+
+
+class TestLargestTriangleThreeBuckets:
+    """
+    Tests de l'algorithme LTTB.
+    """
+
+    def test_keeps_first_and_last_points(self):
+        indices = largest_triangle_three_buckets(range(1000), [i % 7 for i in range(1000)], 50)
+        assert len(indices) == 50
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert indices == sorted(indices)
+
+    def test_preserves_peak(self):
+        y = [0.0] * 500
+        y[237] = 100.0
+        indices = largest_triangle_three_buckets(range(500), y, 20)
+        assert 237 in indices
+
+    def test_short_series_returned_whole(self):
+        assert largest_triangle_three_buckets([1, 2, 3], [1, 2, 3], 10) == [0, 1, 2]
+
+
+class TestDownsampleSeries:
+    """
+    Tests de la réduction des séries CycleMetrics.
+    """
+
+    def test_output_capped_regardless_of_cycle_length(self):
+        for days in (120, 365, 2000):
+            result = downsample_series(growth_series(days), 60, 'weight')
+            assert len(result) == 60
+
+    def test_points_are_original_dicts(self):
+        series = growth_series(200)
+        result = downsample_series(series, 30, 'weight')
+        assert all(point in series for point in result)
+        assert result[0] == series[0]
+        assert result[-1] == series[-1]
+
+    def test_numeric_x_key(self):
+        result = downsample_series(growth_series(300), 25, 'weight', x_key='day')
+        assert len(result) == 25
+
+    def test_series_shorter_than_points_unchanged(self):
+        series = growth_series(10)
+        assert downsample_series(series, 60, 'weight') == series
+
+
+class TestChartPointsParameter:
+    """
+    Tests de validation du paramètre ?points=.
+    """
+
+    def test_clamps_values(self):
+        assert clamp_chart_points('100') == 100
+        assert clamp_chart_points('100000') == MAX_CHART_POINTS
+        assert clamp_chart_points('1') == 3
+        assert clamp_chart_points('abc') == DEFAULT_CHART_POINTS
+        assert clamp_chart_points(None) == DEFAULT_CHART_POINTS
+
+
+class TestCachedDownsampledSeries:
+    """
+    Tests du cache par cycle et version.
+    """
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_cached_per_version(self):
+        series = growth_series(400)
+        first = get_cached_downsampled_series('cycle-1', 'v1', 'growth', series, 40, 'weight')
+        # Même version : le cache est utilisé même si la série change
+        cached = get_cached_downsampled_series('cycle-1', 'v1', 'growth', series[:100], 40, 'weight')
+        assert cached == first
+        # Nouvelle version : recalcul
+        refreshed = get_cached_downsampled_series('cycle-1', 'v2', 'growth', series[:100], 40, 'weight')
+        assert refreshed[-1] == series[99]
@@ -0,0 +1,92 @@
+"""
+Tests unitaires pour l'index en mémoire du guide nutritionnel.
+"""
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from aquaculture import guide_index
+from aquaculture.calculators import AquacultureCalculator
+from aquaculture.constants import SPECIES_CHOICES
+from aquaculture.guide_index import NutritionalGuideIndex, get_guide_index, invalidate_guide_index
+
+
+class TestNutritionalGuideIndex:
+    """
+    Tests de la recherche dichotomique par espèce et poids.
+    """
+
+    def setup_method(self):
+        self.index = NutritionalGuideIndex([
+            {'species': 'clarias', 'growth_stage': 'juvenile', 'min_weight': Decimal('15'), 'max_weight': Decimal('80')},
+            {'species': 'clarias', 'growth_stage': 'alevin', 'min_weight': Decimal('0'), 'max_weight': Decimal('15')},
+            {'species': 'clarias', 'growth_stage': 'finition', 'min_weight': Decimal('200'), 'max_weight': None},
+        ])
+
+    def test_lookup_by_weight_range(self):
+        assert self.index.get_growth_stage('clarias', Decimal('3')) == 'alevin'
+        assert self.index.get_growth_stage('clarias', Decimal('15')) == 'juvenile'
+        assert self.index.get_growth_stage('clarias', Decimal('79.99')) == 'juvenile'
+        assert self.index.get_growth_stage('clarias', Decimal('5000')) == 'finition'
+
+    def test_gap_between_ranges_returns_none(self):
+        assert self.index.get_growth_stage('clarias', Decimal('120')) is None
+
+    def test_unknown_species_returns_none(self):
+        assert 'carpe' not in self.index
+        assert self.index.lookup('carpe', Decimal('10')) is None
+
+    def test_weight_below_first_range_uses_first_stage(self):
+        assert self.index.get_growth_stage('clarias', Decimal('-1')) == 'alevin'
+
+
+class TestGuideIndexCache:
+    """
+    Tests du cache par processus invalidé par numéro de version.
+    """
+
+    def setup_method(self):
+        cache.clear()
+        guide_index._index = None
+        guide_index._index_version = None
+        guide_index._version_checked_at = None
+
+    def test_index_reused_until_invalidated(self):
+        with patch.object(guide_index, 'load_guide_rows', wraps=guide_index.load_guide_rows) as loader:
+            first = get_guide_index()
+            assert get_guide_index() is first
+            assert loader.call_count == 1
+
+            invalidate_guide_index()
+            assert get_guide_index() is not first
+            assert loader.call_count == 2
+
+    def test_version_checked_at_most_every_interval(self):
+        first = get_guide_index()
+        with patch.object(guide_index, 'get_guide_version') as get_version:
+            for _ in range(100):
+                assert get_guide_index() is first
+            assert get_version.call_count == 0
+
+    def test_other_process_invalidation_seen_after_interval(self, monkeypatch):
+        first = get_guide_index()
+        # Invalidation par un autre processus : seul le cache partagé change
+        cache.incr(guide_index.GUIDE_VERSION_CACHE_KEY)
+        assert get_guide_index() is first
+
+        monkeypatch.setattr(guide_index, 'GUIDE_VERSION_CHECK_SECONDS', 0)
+        assert get_guide_index() is not first
+
+    @pytest.mark.django_db
+    def test_growth_stage_needs_no_query(self, django_assert_num_queries):
+        get_guide_index()
+        with django_assert_num_queries(0):
+            for _ in range(1000):
+                AquacultureCalculator.get_growth_stage('tilapia', Decimal('42'))
+
+    def test_all_species_supported(self):
+        for species, _label in SPECIES_CHOICES:
+            assert AquacultureCalculator.get_growth_stage(species, Decimal('5')) == 'alevin'
+            assert AquacultureCalculator.get_growth_stage(species, Decimal('500')) == 'finition'
@@ -0,0 +1,57 @@
+"""
+Tests unitaires pour le traitement des photos du journal sanitaire.
+"""
+import pytest
+from django.core.files.storage import FileSystemStorage
+from PIL import Image
+
+from aquaculture.photos import (
+    PHOTO_VARIANTS,
+    generate_photo_variants,
+    photo_path,
+    store_photo,
+)
+from jobs.models import Job
+from tests.fixtures.factories import make_photo
+
+
+@pytest.mark.django_db
+class TestStorePhoto:
+    """
+    Tests de l'enregistrement adressé par contenu.
+    """
+
+    def setup_method(self):
+        self.photo = make_photo()
+
+    def test_duplicate_upload_stored_once(self, tmp_path):
+        storage = FileSystemStorage(location=tmp_path)
+        first = store_photo(self.photo, storage=storage)
+        second = store_photo(make_photo(), storage=storage)
+
+        assert first == second
+        assert storage.exists(photo_path(first))
+        assert len(list((tmp_path / 'sanitary_logs' / first[:2] / first).iterdir())) == 1
+        assert Job.objects.filter(coalesce_key=f'photo:{first}').count() == 1
+
+    def test_original_resized_and_exif_stripped(self, tmp_path):
+        storage = FileSystemStorage(location=tmp_path)
+        digest = store_photo(self.photo, storage=storage)
+
+        with storage.open(photo_path(digest)) as stored, Image.open(stored) as image:
+            assert image.format == 'WEBP'
+            # Orientation appliquée (rotation de 90°) puis réduction
+            assert image.height <= PHOTO_VARIANTS['original'][1]
+            assert image.width < image.height
+            assert not image.getexif()
+
+    def test_variants_generated_by_job(self, tmp_path):
+        storage = FileSystemStorage(location=tmp_path)
+        digest = store_photo(self.photo, storage=storage, generate_variants=False)
+
+        generate_photo_variants(digest, storage=storage)
+
+        for variant, (width, height) in PHOTO_VARIANTS.items():
+            with storage.open(photo_path(digest, variant)) as stored, Image.open(stored) as image:
+                assert image.width <= width and image.height <= height
+        assert storage.size(photo_path(digest, 'thumbnail')) < storage.size(photo_path(digest))
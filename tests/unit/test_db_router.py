@@ -0,0 +1,147 @@
+"""
+Tests unitaires pour le routage des lectures vers les réplicas.
+
+Le test d'intégration utilise deux fichiers SQLite : la base principale
+et une copie figée qui joue le rôle de réplica en retard.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from mavecam_api import db_router
+from mavecam_api.db_router import (
+    STICKY_COOKIE_NAME,
+    PrimaryReplicaRouter,
+    ReplicaStickinessMiddleware,
+    primary_reads,
+    reset_routing_state,
+)
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    monkeypatch.setattr(db_router, 'get_replicas', lambda: ['replica_1'])
+    reset_routing_state()
+    yield
+    reset_routing_state()
+
+
+class TestPrimaryReplicaRouter:
+    """
+    Tests des décisions de routage.
+    """
+
+    def setup_method(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_without_replicas_reads_primary(self):
+        reset_routing_state()
+        assert self.router.db_for_read(None) == 'default'
+
+    def test_reads_go_to_replica(self, replicas):
+        assert self.router.db_for_read(None) == 'replica_1'
+
+    def test_write_pins_following_reads(self, replicas):
+        assert self.router.db_for_write(None) == 'default'
+        assert self.router.db_for_read(None) == 'default'
+
+    def test_primary_reads_context(self, replicas):
+        with primary_reads():
+            assert self.router.db_for_read(None) == 'default'
+        assert self.router.db_for_read(None) == 'replica_1'
+
+    def test_migrations_only_on_primary(self):
+        assert self.router.allow_migrate('default', 'accounts')
+        assert not self.router.allow_migrate('replica_1', 'accounts')
+
+
+class TestReplicaStickinessMiddleware:
+    """
+    Tests de la stickiness après écriture.
+    """
+
+    def setup_method(self):
+        self.factory = RequestFactory()
+        self.routed = []
+
+    def view(self, write=False):
+        def get_response(request):
+            router = PrimaryReplicaRouter()
+            if write:
+                router.db_for_write(None)
+            self.routed.append(router.db_for_read(None))
+            return HttpResponse()
+        return ReplicaStickinessMiddleware(get_response)
+
+    def test_write_sets_sticky_cookie(self, replicas, settings):
+        settings.DB_REPLICA_STICKY_SECONDS = 10
+        response = self.view(write=True)(self.factory.get('/api/accounts/profile/'))
+        assert self.routed == ['default']
+        assert response.cookies[STICKY_COOKIE_NAME]['max-age'] == 10
+
+    def test_sticky_cookie_keeps_reads_on_primary(self, replicas):
+        request = self.factory.get('/api/accounts/profile/')
+        request.COOKIES[STICKY_COOKIE_NAME] = str(time.time() + 5)
+        self.view()(request)
+
+        expired = self.factory.get('/api/accounts/profile/')
+        expired.COOKIES[STICKY_COOKIE_NAME] = str(time.time() - 5)
+        response = self.view()(expired)
+
+        assert self.routed == ['default', 'replica_1']
+        assert STICKY_COOKIE_NAME not in response.cookies
+
+    def test_unsafe_method_reads_primary(self, replicas):
+        self.view()(self.factory.post('/api/accounts/farm/'))
+        assert self.routed == ['default']
+
+    def test_state_reset_after_request(self, replicas):
+        self.view(write=True)(self.factory.get('/'))
+        assert PrimaryReplicaRouter().db_for_read(None) == 'replica_1'
+
+
+class TestTwoSQLiteFiles:
+    """
+    Test d'intégration : base principale + réplica SQLite en retard.
+    """
+
+    def run_manage(self, env, *args):
+        return subprocess.run(
+            [sys.executable, 'manage.py', *args],
+            cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+
+    def test_read_your_writes_with_lagging_replica(self, tmp_path):
+        primary = tmp_path / 'primary.sqlite3'
+        replica = tmp_path / 'replica.sqlite3'
+        env = {
+            **os.environ, 'DB_NAME': str(primary), 'DJANGO_SETTINGS_MODULE': 'mavecam_api.settings',
+            'CACHE_BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+
+        self.run_manage(env, 'migrate', '--verbosity', '0')
+        # Le réplica est une copie figée : il ne verra pas les écritures suivantes
+        shutil.copy(primary, replica)
+
+        output = self.run_manage({**env, 'DB_REPLICAS': str(replica)}, 'shell', '-c', (
+            "from accounts.models import User\n"
+            "from mavecam_api.db_router import reset_routing_state\n"
+            "User.objects.create_user(phone_number='+237690000001', first_name='Awa',"
+            " last_name='Ngo', password='secret123', age_group='26_35')\n"
+            "print(User.objects.count())\n"
+            "reset_routing_state()\n"
+            "print(User.objects.count())\n"
+        ))
+
+        after_write, from_replica = output.split()
+        assert after_write == '1'
+        assert from_replica == '0'
@@ -0,0 +1,285 @@
+"""
+Tests unitaires pour la file de travaux asynchrones en base.
+
+Teste le regroupement par clé, la réservation, les reprises et le worker.
+"""
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import OperationalError
+from django.utils import timezone
+
+from jobs import queue
+from jobs.models import Job, PeriodicSchedule
+from jobs.queue import (
+    claim_jobs,
+    heartbeat,
+    queue_stats,
+    register_job,
+    requeue_stale_jobs,
+    retry_delay,
+    run_job,
+    schedule_periodic_jobs,
+)
+
+calls = []
+
+
+@pytest.fixture
+def no_installed_schedules(db):
+    """Désactive les planifications créées par les migrations des applications."""
+    PeriodicSchedule.objects.update(is_active=False)
+
+
+@register_job(name='tests.record_call')
+def record_call(value, multiplier=1):
+    calls.append(value * multiplier)
+
+
+@register_job(name='tests.always_fails', max_attempts=2)
+def always_fails():
+    raise RuntimeError('boom')
+
+
+@pytest.mark.django_db
+class TestEnqueue:
+    """
+    Tests de l'ajout de travaux à la file.
+    """
+
+    def test_delay_creates_pending_job(self):
+        job = record_call.delay(3, multiplier=2)
+        assert job.status == Job.STATUS_PENDING
+        assert job.name == 'tests.record_call'
+        assert job.args == [3]
+        assert job.kwargs == {'multiplier': 2}
+
+    def test_coalesce_key_keeps_single_pending_job(self):
+        first = record_call.enqueue(args=[1], coalesce_key='cycle:42')
+        second = record_call.enqueue(args=[2], coalesce_key='cycle:42')
+        assert first.pk == second.pk
+        assert Job.objects.filter(coalesce_key='cycle:42').count() == 1
+
+    def test_coalesce_key_allows_new_job_once_previous_is_running(self):
+        first = record_call.enqueue(args=[1], coalesce_key='cycle:42')
+        claim_jobs('worker-1')
+        second = record_call.enqueue(args=[2], coalesce_key='cycle:42')
+        assert second.pk != first.pk
+
+    def test_concurrent_job_claimed_before_lookup(self, monkeypatch):
+        from django.db.models.query import QuerySet
+
+        pending = record_call.enqueue(args=[1], coalesce_key='cycle:42')
+        original_first = QuerySet.first
+        lookups = []
+
+        def racing_first(queryset):
+            lookups.append(queryset)
+            if len(lookups) == 1:
+                return None  # le travail concurrent n'est pas encore visible
+            claim_jobs('worker-1')  # puis il est réservé avant la relecture
+            return original_first(queryset)
+
+        monkeypatch.setattr(QuerySet, 'first', racing_first)
+        job = record_call.enqueue(args=[2], coalesce_key='cycle:42')
+        assert job.pk != pending.pk
+        assert job.status == Job.STATUS_PENDING
+
+
+@pytest.mark.django_db
+class TestClaimAndRun:
+    """
+    Tests de la réservation et de l'exécution des travaux.
+    """
+
+    def setup_method(self):
+        calls.clear()
+
+    def test_claim_marks_jobs_running(self):
+        for value in range(3):
+            record_call.delay(value)
+        jobs = claim_jobs('worker-1', limit=2)
+        assert len(jobs) == 2
+        assert all(job.status == Job.STATUS_RUNNING and job.locked_by == 'worker-1' for job in jobs)
+        assert len(claim_jobs('worker-2', limit=10)) == 1
+
+    def test_claim_reads_primary_with_replicas(self, monkeypatch):
+        from mavecam_api import db_router
+
+        record_call.delay(1)
+        # Un réplica inexistant : toute lecture routée vers lui échouerait
+        monkeypatch.setattr(db_router, 'get_replicas', lambda: ['replica_1'])
+        db_router.reset_routing_state()
+        try:
+            assert len(claim_jobs('worker-1')) == 1
+        finally:
+            db_router.reset_routing_state()
+
+    def test_future_jobs_not_claimed(self):
+        record_call.enqueue(args=[1], run_at=timezone.now() + timedelta(hours=1))
+        assert claim_jobs('worker-1') == []
+
+    def test_same_key_not_run_concurrently(self):
+        record_call.enqueue(args=[1], coalesce_key='cycle:7')
+        claim_jobs('worker-1')
+        record_call.enqueue(args=[2], coalesce_key='cycle:7')
+        assert claim_jobs('worker-2') == []
+
+    def test_run_job_success(self):
+        record_call.delay(5, multiplier=3)
+        job = claim_jobs('worker-1')[0]
+        assert run_job(job) is True
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_DONE
+        assert calls == [15]
+
+    def test_failed_job_retried_with_backoff_then_abandoned(self):
+        always_fails.delay()
+        job = claim_jobs('worker-1')[0]
+
+        assert run_job(job) is False
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_PENDING
+        assert job.run_at > timezone.now()
+        assert 'boom' in job.last_error
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        job = claim_jobs('worker-1')[0]
+        run_job(job)
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_FAILED
+        assert job.attempts == 2
+
+    def test_retry_delay_is_exponential(self, settings):
+        settings.JOBS_RETRY_BASE_DELAY = 10
+        settings.JOBS_RETRY_MAX_DELAY = 60
+        assert [retry_delay(n).total_seconds() for n in (1, 2, 3, 4)] == [10, 20, 40, 60]
+
+    def test_stale_running_job_requeued(self):
+        record_call.delay(1)
+        job = claim_jobs('worker-1')[0]
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+        assert requeue_stale_jobs(timeout=60) == 1
+        job.refresh_from_db()
+        assert job.status == Job.STATUS_PENDING
+        assert job.attempts == 1  # l'exécution interrompue compte
+
+    def test_job_killing_its_worker_abandoned(self):
+        always_fails.delay()  # max_attempts=2
+        for expected in (Job.STATUS_PENDING, Job.STATUS_FAILED):
+            job = claim_jobs('worker-1')[0]
+            Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+            requeue_stale_jobs(timeout=60)
+            job.refresh_from_db()
+            assert job.status == expected
+        assert job.attempts == 2
+
+    def test_heartbeat_keeps_long_job_reserved(self):
+        record_call.delay(1)
+        job = claim_jobs('worker-1')[0]
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+        assert heartbeat('worker-1') == 1
+        assert requeue_stale_jobs(timeout=60) == 0
+
+    def test_result_of_requeued_job_not_overwritten(self):
+        record_call.enqueue(args=[1], coalesce_key='cycle:7')
+        first = claim_jobs('worker-1')[0]
+        Job.objects.filter(pk=first.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+        requeue_stale_jobs(timeout=60)
+        second = claim_jobs('worker-2')[0]
+        assert second.pk == first.pk
+
+        # Le premier worker termine après la reprise : la ligne appartient à worker-2
+        run_job(first)
+        second.refresh_from_db()
+        assert second.status == Job.STATUS_RUNNING
+        assert second.locked_by == 'worker-2'
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('no_installed_schedules')
+class TestPeriodicSchedules:
+    """
+    Tests des travaux périodiques.
+    """
+
+    def test_due_schedule_enqueued_once(self):
+        schedule = PeriodicSchedule.objects.create(
+            name='rappels', job_name='tests.record_call',
+            kwargs={'value': 1}, interval_seconds=3600,
+            next_run_at=timezone.now() - timedelta(minutes=1),
+        )
+        assert schedule_periodic_jobs() == 1
+        assert schedule_periodic_jobs() == 0
+
+        schedule.refresh_from_db()
+        assert schedule.next_run_at > timezone.now()
+        assert Job.objects.filter(coalesce_key='periodic:rappels').count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('no_installed_schedules')
+class TestRunJobsCommand:
+    """
+    Tests de la commande worker.
+    """
+
+    def setup_method(self):
+        calls.clear()
+
+    def test_once_processes_queue_and_reports_throughput(self):
+        for value in range(5):
+            record_call.delay(value)
+        always_fails.delay()
+
+        out = StringIO()
+        call_command('run_jobs', '--once', '--threads', '1', stdout=out)
+
+        assert sorted(calls) == [0, 1, 2, 3, 4]
+        assert 'travaux/s' in out.getvalue()
+        stats = queue_stats()
+        assert stats[Job.STATUS_DONE] == 5
+        assert stats[Job.STATUS_PENDING] == 1
+
+    def test_bookkeeping_error_does_not_stop_worker(self, monkeypatch):
+        for value in range(3):
+            record_call.delay(value)
+        original_save = queue._save_result
+
+        def locked_save(job, **fields):
+            if job.args == [1]:
+                raise OperationalError('database is locked')
+            return original_save(job, **fields)
+
+        monkeypatch.setattr(queue, '_save_result', locked_save)
+        call_command('run_jobs', '--once', '--threads', '1', stdout=StringIO())
+
+        assert sorted(calls) == [0, 1, 2]
+        stats = queue_stats()
+        assert stats[Job.STATUS_DONE] == 2
+        assert stats[Job.STATUS_RUNNING] == 1  # repris par requeue_stale_jobs
+
+    def test_locked_database_does_not_stop_worker(self, monkeypatch):
+        from jobs.management.commands import run_jobs
+
+        for value in range(2):
+            record_call.delay(value)
+        failures = [OperationalError('database is locked')]
+
+        def locked_requeue():
+            if failures:
+                raise failures.pop()
+            return requeue_stale_jobs()
+
+        monkeypatch.setattr(run_jobs, 'requeue_stale_jobs', locked_requeue)
+        monkeypatch.setattr(run_jobs.time, 'sleep', lambda seconds: None)
+        call_command('run_jobs', '--max-jobs', '2', '--threads', '1', stdout=StringIO())
+
+        assert sorted(calls) == [0, 1]
+
+    def test_single_thread_by_default_on_sqlite(self):
+        from django.conf import settings
+
+        assert settings.JOBS_WORKER_THREADS == 1
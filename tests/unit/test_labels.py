@@ -0,0 +1,57 @@
+"""
+Tests unitaires pour les libellés de choix précalculés par langue.
+"""
+import pytest
+from django.utils import translation
+
+from accounts.labels import build_label_maps, choice_label, get_label_maps
+from accounts.serializers import FarmProfileSerializer
+
+
+class TestLabelMaps:
+    """
+    Tests des dictionnaires de libellés.
+    """
+
+    def test_labels_translated_per_language(self):
+        assert choice_label('region', 'extreme_nord', 'fr') == 'Extrême-Nord'
+        assert choice_label('region', 'extreme_nord', 'en') == 'Far North'
+        assert choice_label('certification_status', 'certified', 'en') == 'Certified'
+
+    def test_active_language_used_by_default(self):
+        with translation.override('en'):
+            assert choice_label('account_type', 'company') == 'Company'
+        with translation.override('fr-fr'):
+            assert choice_label('account_type', 'company') == 'Entreprise'
+
+    def test_unknown_and_empty_values(self):
+        assert choice_label('region', 'atlantide') == 'atlantide'
+        assert choice_label('region', '') == ''
+        assert choice_label('region', None) == ''
+
+    def test_maps_are_frozen(self):
+        with pytest.raises(TypeError):
+            get_label_maps('fr')['region']['nord'] = 'Autre'
+
+    def test_rebuilt_when_languages_change(self, settings):
+        settings.LANGUAGES = [('fr', 'Français')]
+        assert set(build_label_maps()) == {'fr'}
+        assert choice_label('region', 'nord', 'en') == 'Nord'
+
+
+@pytest.mark.django_db
+class TestLabelConsumers:
+    """
+    Tests des libellés dans le serializer et l'endpoint de référence.
+    """
+
+    def test_farm_profile_certification_display(self, authenticated_user):
+        with translation.override('en'):
+            data = FarmProfileSerializer(authenticated_user.farm_profile).data
+        assert data['certification_status_display'] == 'Pending'
+
+    def test_choices_endpoint(self, api_client):
+        response = api_client.get('/api/accounts/choices/', HTTP_ACCEPT_LANGUAGE='en')
+        assert response.status_code == 200
+        assert response.data['region']['sud_ouest'] == 'South-West'
+        assert response.data['age_group']['65_plus'] == '65 years and over'
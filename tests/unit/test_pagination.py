@@ -0,0 +1,100 @@
+"""
+Tests unitaires pour la pagination par curseur (keyset).
+
+Utilise le modèle Job (created_at, id) comme liste de référence.
+"""
+from datetime import timedelta
+
+import json
+from base64 import urlsafe_b64encode
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from jobs.models import Job
+from mavecam_api.pagination import KeysetPagination
+
+factory = APIRequestFactory()
+
+
+def paginate(url, queryset=None, view=None):
+    paginator = KeysetPagination()
+    request = Request(factory.get(url))
+    results = paginator.paginate_queryset(queryset or Job.objects.all(), request, view)
+    return paginator, [job.pk for job in results]
+
+
+def follow(link):
+    return link.replace('http://testserver', '')
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """
+    Tests du parcours par curseur.
+    """
+
+    def setup_method(self):
+        now = timezone.now()
+        Job.objects.bulk_create([Job(name='tests.page') for _ in range(7)])
+        self.ids = list(Job.objects.order_by('-id').values_list('id', flat=True))
+        # Les quatre derniers travaux partagent le même created_at : départage par id
+        for offset, pk in enumerate(self.ids):
+            Job.objects.filter(pk=pk).update(created_at=now - timedelta(seconds=min(offset, 3)))
+
+    def test_walks_all_pages_in_order(self):
+        seen = []
+        paginator, page = paginate('/api/jobs/?page_size=3')
+        seen += page
+        while paginator.get_next_link():
+            paginator, page = paginate(follow(paginator.get_next_link()))
+            seen += page
+        assert seen == self.ids
+
+    def test_previous_link_returns_previous_page(self):
+        first, first_page = paginate('/api/jobs/?page_size=3')
+        assert first.get_previous_link() is None
+
+        second, _page = paginate(follow(first.get_next_link()))
+        _previous, page = paginate(follow(second.get_previous_link()))
+        assert page == first_page
+
+    def test_stable_under_concurrent_inserts(self):
+        first, first_page = paginate('/api/jobs/?page_size=3')
+        Job.objects.create(name='tests.page')  # arrive en tête de liste
+        _second, second_page = paginate(follow(first.get_next_link()))
+        assert second_page == self.ids[3:6]
+
+    def test_custom_ordering_from_view(self):
+        view = type('View', (), {'pagination_ordering': ('id',)})()
+        _paginator, page = paginate('/api/jobs/?page_size=2', view=view)
+        assert page == sorted(self.ids)[:2]
+
+    def test_approximate_total_capped(self, settings):
+        settings.PAGINATION_COUNT_CAP = 5
+        paginator, _page = paginate('/api/jobs/?include_total=1')
+        response = paginator.get_paginated_response([])
+        assert response.data['count'] == 5
+        assert response.data['count_is_approximate'] is True
+
+    def test_no_total_by_default(self):
+        paginator, _page = paginate('/api/jobs/')
+        assert 'count' not in paginator.get_paginated_response([]).data
+
+    def test_invalid_cursor(self):
+        with pytest.raises(NotFound):
+            paginate('/api/jobs/?cursor=pas-un-curseur')
+
+    @pytest.mark.parametrize('values', [
+        ['garbage', 'x'],
+        ['2026-01-01T00:00:00', 'x'],
+        [None, 1],
+        [{'a': 1}, [2]],
+    ])
+    def test_tampered_cursor(self, values):
+        cursor = urlsafe_b64encode(json.dumps({'v': values, 'r': 0}).encode()).decode()
+        with pytest.raises(NotFound):
+            paginate(f'/api/jobs/?cursor={cursor}')
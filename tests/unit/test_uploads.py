@@ -0,0 +1,261 @@
+"""
+Tests unitaires pour les envois reprenables par morceaux.
+
+Simule des coupures réseau : morceaux perdus, renvoyés ou corrompus.
+"""
+import hashlib
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from aquaculture.photos import IMMUTABLE_CACHE_CONTROL, photo_path, store_photo
+from jobs.models import PeriodicSchedule
+from uploads.models import UploadSession
+from tests.fixtures.factories import make_photo
+from uploads.services import expire_upload_sessions
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def upload_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.UPLOAD_CHUNK_SIZE = 1024
+    return settings
+
+
+@pytest.mark.django_db
+class TestUploadProtocol:
+    """
+    Tests du protocole session / morceaux / assemblage.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, auth_client, upload_settings):
+        self.client = auth_client
+        self.media_root = upload_settings.MEDIA_ROOT
+        self.content = make_photo((400, 300)).getvalue()
+
+    def open_session(self, content, kind='photo'):
+        response = self.client.post('/api/uploads/', {
+            'kind': kind, 'total_size': len(content), 'checksum': sha256(content),
+        }, format='json')
+        assert response.status_code == 201
+        assert response.data['chunk_size'] == 1024
+        return f"/api/uploads/{response.data['id']}/"
+
+    def put_chunk(self, url, content, offset, checksum=None):
+        chunk = content[offset:offset + 1024]
+        return self.client.generic(
+            'PUT', url, chunk, content_type='application/octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset),
+            HTTP_UPLOAD_CHECKSUM=checksum or sha256(chunk),
+        )
+
+    def test_photo_assembled_and_stored(self):
+        url = self.open_session(self.content)
+        for offset in range(0, len(self.content), 1024):
+            response = self.put_chunk(url, self.content, offset)
+            assert response.status_code == 200
+
+        assert response.data['status'] == UploadSession.STATUS_COMPLETE
+        digest = response.data['result']
+        assert os.path.exists(os.path.join(self.media_root, photo_path(digest)))
+
+    def test_resume_after_lost_chunk(self):
+        url = self.open_session(self.content)
+        self.put_chunk(url, self.content, 0)
+
+        # Le morceau 1024 s'est perdu, le client envoie 2048
+        response = self.put_chunk(url, self.content, 2048)
+        assert response.status_code == 409
+        assert response['Upload-Offset'] == '1024'
+
+        # Après la coupure, le client demande l'offset et reprend
+        assert self.client.get(url)['Upload-Offset'] == '1024'
+        assert self.put_chunk(url, self.content, 1024).status_code == 200
+
+    def test_replayed_chunk_is_ignored(self):
+        url = self.open_session(self.content)
+        self.put_chunk(url, self.content, 0)
+        response = self.put_chunk(url, self.content, 0)
+        assert response.status_code == 200
+        assert response['Upload-Offset'] == '1024'
+
+    def test_corrupted_chunk_rejected(self):
+        url = self.open_session(self.content)
+        response = self.put_chunk(url, self.content, 0, checksum='0' * 64)
+        assert response.status_code == 400
+        assert self.client.get(url)['Upload-Offset'] == '0'
+
+    def test_wrong_file_checksum_fails_session(self):
+        content = b'x' * 1500
+        response = self.client.post('/api/uploads/', {
+            'kind': 'sync_batch', 'total_size': len(content), 'checksum': sha256(b'autre'),
+        }, format='json')
+        url = f"/api/uploads/{response.data['id']}/"
+
+        self.put_chunk(url, content, 0)
+        response = self.put_chunk(url, content, 1024)
+        assert response.status_code == 410
+        assert response.data['status'] == UploadSession.STATUS_FAILED
+
+    def test_unreadable_photo_fails_session(self):
+        content = b'pas une image' * 100
+        url = self.open_session(content)
+        for offset in range(0, len(content), 1024):
+            response = self.put_chunk(url, content, offset)
+
+        assert response.status_code == 410
+        assert response.data['status'] == UploadSession.STATUS_FAILED
+        assert not os.listdir(os.path.join(self.media_root, 'upload_sessions'))
+        # Nouvelle tentative du dernier morceau : la session reste échouée
+        assert self.put_chunk(url, content, 1024).status_code == 410
+
+    def test_interrupted_completion_finished_on_retry(self):
+        url = self.open_session(self.content)
+        offsets = range(0, len(self.content), 1024)
+        for offset in offsets:
+            if offset == offsets[-1]:
+                break
+            self.put_chunk(url, self.content, offset)
+
+        # Dernier morceau écrit mais le processus s'arrête avant l'assemblage
+        session = UploadSession.objects.get()
+        with open(session.part_path, 'r+b') as part:
+            part.seek(offsets[-1])
+            part.write(self.content[offsets[-1]:])
+        UploadSession.objects.filter(pk=session.pk).update(received_bytes=len(self.content))
+
+        response = self.put_chunk(url, self.content, offsets[-1])
+        assert response.status_code == 200
+        assert response.data['status'] == UploadSession.STATUS_COMPLETE
+
+    def upload_all_but_last(self):
+        url = self.open_session(self.content)
+        offsets = list(range(0, len(self.content), 1024))
+        for offset in offsets[:-1]:
+            self.put_chunk(url, self.content, offset)
+        return url, offsets[-1]
+
+    def test_final_chunk_retried_during_assembly(self):
+        url, last = self.upload_all_but_last()
+        inner = []
+
+        def slow_store_photo(part):
+            # Le client renvoie le dernier morceau pendant le traitement de la photo
+            inner.append(self.put_chunk(url, self.content, last))
+            return store_photo(part)
+
+        with patch('uploads.services.store_photo', slow_store_photo):
+            response = self.put_chunk(url, self.content, last)
+
+        assert inner[0].status_code == 200
+        assert inner[0].data['status'] == UploadSession.STATUS_ASSEMBLING
+        assert response.status_code == 200
+        assert response.data['status'] == UploadSession.STATUS_COMPLETE
+        # Et encore après la fin de l'assemblage
+        retry = self.put_chunk(url, self.content, last)
+        assert retry.status_code == 200
+        assert retry.data['status'] == UploadSession.STATUS_COMPLETE
+
+    def test_failure_does_not_overwrite_closed_session(self):
+        url, last = self.upload_all_but_last()
+
+        def expired_during_store(part):
+            UploadSession.objects.update(status=UploadSession.STATUS_EXPIRED)
+            raise OSError('stockage indisponible')
+
+        with patch('uploads.services.store_photo', expired_during_store):
+            self.put_chunk(url, self.content, last)
+        assert UploadSession.objects.get().status == UploadSession.STATUS_EXPIRED
+
+    def test_sync_batch_kept_in_storage(self):
+        content = b'{"logs": []}'
+        url = self.open_session(content, kind='sync_batch')
+        response = self.put_chunk(url, content, 0)
+        assert response.data['result'].startswith('sync_batches/')
+
+    def test_other_user_session_not_found(self, user_factory, api_client):
+        url = self.open_session(self.content)
+        other = user_factory(phone_number='+237699999999', email='autre@mavecam.com')
+        api_client.force_authenticate(other)
+        assert api_client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+class TestExpireUploadSessions:
+    """
+    Tests de l'expiration des envois abandonnés.
+    """
+
+    def test_abandoned_session_expired_and_part_removed(self, authenticated_user, upload_settings):
+        session = UploadSession.objects.create(
+            user=authenticated_user, kind='photo', total_size=2048,
+            checksum='0' * 64, chunk_size=1024,
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        os.makedirs(os.path.dirname(session.part_path))
+        open(session.part_path, 'wb').close()
+
+        assert expire_upload_sessions() == 1
+        session.refresh_from_db()
+        assert session.status == UploadSession.STATUS_EXPIRED
+        assert not os.path.exists(session.part_path)
+
+    def test_hourly_schedule_installed(self):
+        schedule = PeriodicSchedule.objects.get(job_name='uploads.expire_upload_sessions')
+        assert schedule.interval_seconds == 3600
+        assert schedule.is_active
+
+
+@pytest.mark.django_db
+class TestPhotoVariantView:
+    """
+    Tests du service des variantes de photos.
+    """
+
+    def test_variant_served_with_immutable_cache(self, auth_client, upload_settings):
+        digest = store_photo(make_photo(), generate_variants=False)
+
+        response = auth_client.get(f'/api/uploads/photos/{digest}/original.webp')
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'image/webp'
+        assert response['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+        assert b''.join(response.streaming_content)[:4] == b'RIFF'
+
+    def test_not_cacheable_by_shared_proxies(self, auth_client, upload_settings):
+        digest = store_photo(make_photo(), generate_variants=False)
+        response = auth_client.get(f'/api/uploads/photos/{digest}/original.webp')
+        assert 'private' in response['Cache-Control']
+        assert 'public' not in response['Cache-Control']
+
+    def test_revalidation_without_body(self, auth_client, upload_settings):
+        digest = store_photo(make_photo(), generate_variants=False)
+        url = f'/api/uploads/photos/{digest}/original.webp'
+        etag = auth_client.get(url)['ETag']
+
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response['ETag'] == etag
+        assert not response.content
+
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH='"autre"')
+        assert response.status_code == 200
+
+    def test_missing_variant_not_cached(self, auth_client, upload_settings):
+        digest = store_photo(make_photo(), generate_variants=False)
+
+        for variant in ('thumbnail', 'unknown'):
+            response = auth_client.get(f'/api/uploads/photos/{digest}/{variant}.webp')
+            assert response.status_code == 404
+            assert response.get('Cache-Control') != IMMUTABLE_CACHE_CONTROL
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(f"/api/uploads/photos/{'0' * 64}/original.webp")
+        assert response.status_code == 401